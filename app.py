@@ -1,156 +1,224 @@
-from flask import Flask, render_template, request, redirect, session, url_for, flash, get_flashed_messages
-from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask import Blueprint, Flask, current_app, render_template, stream_template, stream_with_context, request, jsonify, redirect, session, url_for, flash, get_flashed_messages
 from sqlalchemy.exc import IntegrityError
 from functools import wraps
+from werkzeug.datastructures import MultiDict
+import math
+import os
+import click
+from datetime import timedelta
 from sqlalchemy.orm import joinedload
+from sqlalchemy.exc import OperationalError
 from flask import abort
 from flask import flash
-
-app = Flask(__name__)
-app.secret_key = 'secret_key_for_session'  # Secret key for sessions and security
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///jobportal.db'  # Database configuration (SQLite)
-db = SQLAlchemy(app)
+from config import Config
+from database import db, init_database, read_session, schema_lock
+from models import User, Job, Application, DeletedJob, utcnow
+from search import (build_match_expression, ranked_matches, ensure_search_index,
+                    rebuild_search_index, index_job, unindex_job)
+from pagination import keyset_paginate, decode_cursor
+from hot_jobs import catalog as hot_job_catalog, FACETS as HOT_JOB_FACETS
+from responses import StaticPayload, payload_response
+from feed import FEED_ARGS, FEED_FORMATS, merge_changes, parse_timestamp, render_feed
+from parsing import parse_salary, parse_experience
+from schema import upgrade_schema
+from cache import ListingCache
+from profiling import Profiler
+from hashing import PasswordHasher, HashingBusy
+from applications import (APPLICATION_UNIQUE_INDEX, ApplicationWriter, WriterBusy, dedupe_applications,
+                          submit_application)
+from bulk import (FORMATS as BULK_FORMATS, EXPORT_JOB_COLUMNS, EXPORT_APPLICATION_COLUMNS,
+                  detect_format, iter_records, import_jobs, iter_table_rows, export_rows)
+
+# All routes and CLI commands live on this blueprint; create_app() registers it
+bp = Blueprint('main', __name__, cli_group=None)
+profiler = Profiler()
+password_hasher = PasswordHasher()
+application_writer = ApplicationWriter()
+
+LAKH = 100_000  # Salary filters on the home page are entered in lakhs per annum (LPA)
+# Largest filter values accepted from the query string; anything beyond is ignored like a malformed value
+MAX_SALARY_FILTER_LPA = 100_000
+MAX_EXPERIENCE_FILTER_YEARS = 100
 
 
 # ===================
-# Database Models
+# Helpers
 # ===================
 
-class User(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)  # Unique username
-    email = db.Column(db.String(120), unique=True, nullable=False)    # Unique email
-    password = db.Column(db.String(200), nullable=False)  # Hashed password
-    role = db.Column(db.String(20), nullable=False)  # Role of user: jobseeker, employer, or admin
+def login_required(f):
+    """Decorator to protect routes for logged-in users only."""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if 'user_id' not in session:
+            return redirect(url_for('main.login'))  # Redirect unauthorized users to login
+        return f(*args, **kwargs)
+    return decorated
 
 
-class Job(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(100))
-    description = db.Column(db.Text)
-    salary = db.Column(db.String(20))
-    location = db.Column(db.String(50))
-    company = db.Column(db.String(50))
-    employer_id = db.Column(db.Integer, db.ForeignKey('user.id'))  # Relation to employer (User)
+def set_job_ranges(job):
+    """Fill the numeric salary/experience columns from the job's text fields."""
+    salary = parse_salary(job.salary)
+    job.salary_min, job.salary_max = salary if salary else (None, None)
+    experience = parse_experience(job.experience)
+    job.experience_min, job.experience_max = experience if experience else (None, None)
 
 
-class Application(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    job_id = db.Column(db.Integer, db.ForeignKey('job.id'))
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
-    job = db.relationship('Job', backref='applications')  # Relationship to job
+def export_chunks(table, fmt, employer_id=None):
+    """Stream a table as CSV/JSONL text chunks; employer_id limits it to that employer's jobs."""
+    if table == 'jobs':
+        columns = [getattr(Job, name) for name in EXPORT_JOB_COLUMNS]
+        where = Job.employer_id == employer_id if employer_id else None
+        rows = iter_table_rows(read_session(), columns, Job.id, where=where)
+        return export_rows(rows, EXPORT_JOB_COLUMNS, fmt)
+    columns = [getattr(Application, name) for name in EXPORT_APPLICATION_COLUMNS]
+    where = None
+    if employer_id:
+        where = Application.job_id.in_(db.select(Job.id).where(Job.employer_id == employer_id))
+    rows = iter_table_rows(read_session(), columns, Application.id, where=where)
+    return export_rows(rows, EXPORT_APPLICATION_COLUMNS, fmt)
 
 
-# ===================
-# Hot Jobs Data (Backend copy for lookup)
-# ===================
-# Static list of demo "hot jobs" for display and applications simulation
-hot_jobs = [
-    {"id": 1, "title": "Frontend Developer", "description": "Work with React.js and build responsive UIs.", "type": "Full Time", "category": "Development", "location": "Bangalore", "salary": "₹8-10 LPA", "company": "TechNova", "experience": "2-4 years"},
-    {"id": 2, "title": "Backend Developer", "description": "Develop APIs using Node.js and Express.", "type": "Full Time", "category": "Development", "location": "Hyderabad", "salary": "₹10-12 LPA", "company": "CodeBase", "experience": "2-4 years"},
-    {"id": 3, "title": "UI/UX Designer", "description": "Design modern and intuitive user interfaces.", "type": "Full Time", "category": "Design", "location": "Mumbai", "salary": "₹6-8 LPA", "company": "DesignHub", "experience": "3-5 years"},
-    {"id": 4, "title": "DevOps Engineer", "description": "Manage CI/CD pipelines and cloud infra.", "type": "Full Time", "category": "DevOps", "location": "Remote", "salary": "₹9-12 LPA", "company": "CloudOps", "experience": "3-6 years"},
-    {"id": 5, "title": "Data Analyst", "description": "Analyze data and provide business insights.", "type": "Full Time", "category": "Data", "location": "Pune", "salary": "₹7-9 LPA", "company": "DataWorks", "experience": "1-3 years"},
-    {"id": 6, "title": "Machine Learning Engineer", "description": "Build ML models and deploy in production.", "type": "Full Time", "category": "AI/ML", "location": "Bangalore", "salary": "₹12-15 LPA", "company": "AI Labs", "experience": "5+ years"},
-    {"id": 7, "title": "Product Manager", "description": "Lead cross-functional teams to build products.", "type": "Full Time", "category": "Product", "location": "Gurgaon", "salary": "₹15-18 LPA", "company": "Prodify", "experience": "6+ years"},
-    {"id": 8, "title": "QA Tester", "description": "Perform manual and automation testing.", "type": "Full Time", "category": "Testing", "location": "Chennai", "salary": "₹5-7 LPA", "company": "BugSquashers", "experience": "0-2 years"},
-    {"id": 9, "title": "Content Writer", "description": "Write blogs, website content, and case studies.", "type": "Full Time", "category": "Content", "location": "Remote", "salary": "₹4-5 LPA", "company": "WriteWave", "experience": "1-3 years"},
-    {"id": 10, "title": "HR Executive", "description": "Handle recruitment and employee engagement.", "type": "Full Time", "category": "HR", "location": "Noida", "salary": "₹4-6 LPA", "company": "PeopleFirst", "experience": "1-3 years"},
-    {"id": 11, "title": "Digital Marketing Executive", "description": "Run paid campaigns and manage SEO.", "type": "Full Time", "category": "Marketing", "location": "Delhi", "salary": "₹5-7 LPA", "company": "GrowthHacks", "experience": "1-3 years"},
-    {"id": 12, "title": "Cloud Architect", "description": "Design and implement cloud solutions.", "type": "Full Time", "category": "Cloud", "location": "Bangalore", "salary": "₹18-22 LPA", "company": "SkyNet", "experience": "6+ years"},
-    {"id": 13, "title": "Sales Manager", "description": "Drive sales strategies and lead teams.", "type": "Full Time", "category": "Sales", "location": "Mumbai", "salary": "₹10-14 LPA", "company": "SellWell", "experience": "4-7 years"},
-    {"id": 14, "title": "Business Analyst", "description": "Analyze business processes and suggest solutions.", "type": "Full Time", "category": "Business", "location": "Chandigarh", "salary": "₹8-10 LPA", "company": "BizConsult", "experience": "3-5 years"},
-    {"id": 15, "title": "Customer Support Executive", "description": "Support customers via chat, mail, and calls.", "type": "Full Time", "category": "Support", "location": "Pune", "salary": "₹3.5-5 LPA", "company": "HelpDeskPro", "experience": "0-1 years"},
-    {"id": 16, "title": "IT Support Engineer", "description": "Provide hardware and software support.", "type": "Full Time", "category": "IT", "location": "Ahmedabad", "salary": "₹4-6 LPA", "company": "SysCare", "experience": "1-3 years"},
-    {"id": 17, "title": "Graphic Designer", "description": "Create visuals for digital platforms.", "type": "Full Time", "category": "Design", "location": "Kolkata", "salary": "₹4-6 LPA", "company": "CreativeCore", "experience": "1-3 years"},
-    {"id": 18, "title": "Android Developer", "description": "Build apps with Kotlin and Java.", "type": "Full Time", "category": "Mobile", "location": "Hyderabad", "salary": "₹6-8 LPA", "company": "AppStorm", "experience": "2-4 years"},
-    {"id": 19, "title": "iOS Developer", "description": "Develop iOS apps with Swift.", "type": "Full Time", "category": "Mobile", "location": "Chennai", "salary": "₹7-9 LPA", "company": "SwiftTech", "experience": "2-4 years"},
-    {"id": 20, "title": "Video Editor", "description": "Edit and produce marketing videos.", "type": "Full Time", "category": "Media", "location": "Mumbai", "salary": "₹3.5-5 LPA", "company": "VidEditz", "experience": "1-3 years"},
-    {"id": 21, "title": "SEO Specialist", "description": "Optimize site rankings and content.", "type": "Full Time", "category": "Marketing", "location": "Delhi", "salary": "₹4-6 LPA", "company": "RankHigh", "experience": "2-4 years"},
-    {"id": 22, "title": "Social Media Manager", "description": "Manage content and grow online presence.", "type": "Full Time", "category": "Marketing", "location": "Remote", "salary": "₹5-7 LPA", "company": "Socioly", "experience": "2-5 years"},
-    {"id": 23, "title": "Technical Writer", "description": "Write product guides and documentation.", "type": "Full Time", "category": "Content", "location": "Bangalore", "salary": "₹6-8 LPA", "company": "DocuTech", "experience": "3-5 years"},
-    {"id": 24, "title": "Cybersecurity Analyst", "description": "Protect systems from cyber threats.", "type": "Full Time", "category": "Security", "location": "Gurgaon", "salary": "₹10-13 LPA", "company": "SecureNet", "experience": "4-7 years"},
-    {"id": 25, "title": "AI Researcher", "description": "Work on NLP and computer vision models.", "type": "Full Time", "category": "AI/ML", "location": "Pune", "salary": "₹15-20 LPA", "company": "AIThinkTank", "experience": "6+ years"},
-    {"id": 26, "title": "Project Coordinator", "description": "Coordinate tasks and maintain timelines.", "type": "Full Time", "category": "Management", "location": "Chennai", "salary": "₹5-7 LPA", "company": "PlanIt", "experience": "2-4 years"},
-    {"id": 27, "title": "Technical Support Engineer", "description": "Resolve client issues and provide tech support.", "type": "Full Time", "category": "Support", "location": "Bangalore", "salary": "₹4-6 LPA", "company": "TechHelp", "experience": "1-3 years"},
-    {"id": 28, "title": "Recruiter", "description": "Source and screen potential candidates.", "type": "Full Time", "category": "HR", "location": "Jaipur", "salary": "₹4.5-6 LPA", "company": "HireRight", "experience": "2-4 years"},
-    {"id": 29, "title": "Legal Associate", "description": "Draft contracts and handle legal work.", "type": "Full Time", "category": "Legal", "location": "Delhi", "salary": "₹6-8 LPA", "company": "LawVerse", "experience": "3-5 years"},
-    {"id": 30, "title": "Operations Manager", "description": "Handle daily ops and process improvement.", "type": "Full Time", "category": "Operations", "location": "Kolkata", "salary": "₹9-11 LPA", "company": "Opsify", "experience": "5+ years"},
-    {"id": 31, "title": "Game Developer", "description": "Develop engaging 2D/3D games.", "type": "Full Time", "category": "Gaming", "location": "Pune", "salary": "₹10-14 LPA", "company": "PlayZone", "experience": "3-5 years"},
-    {"id": 32, "title": "Graphic Designer", "description": "Create marketing visuals and assets.", "type": "Part Time", "category": "Design", "location": "Delhi", "salary": "₹4-6 LPA", "company": "DesignMinds", "experience": "0-1 years"},
-    {"id": 33, "title": "Security Analyst", "description": "Monitor and prevent cyber threats.", "type": "Full Time", "category": "Security", "location": "Mumbai", "salary": "₹9-11 LPA", "company": "CyberSafe", "experience": "4-7 years"},
-    {"id": 34, "title": "Product Manager", "description": "Lead product development lifecycle.", "type": "Full Time", "category": "Management", "location": "Remote", "salary": "₹20-25 LPA", "company": "InnovateX", "experience": "6+ years"},
-    {"id": 35, "title": "iOS Developer", "description": "Develop native iOS apps.", "type": "Full Time", "category": "Mobile", "location": "Chennai", "salary": "₹10-13 LPA", "company": "SwiftMob", "experience": "2-5 years"},
-    {"id": 36, "title": "Android Developer", "description": "Create Android mobile applications.", "type": "Full Time", "category": "Mobile", "location": "Noida", "salary": "₹9-12 LPA", "company": "DroidBuild", "experience": "2-5 years"},
-    {"id": 37, "title": "Digital Marketing Intern", "description": "Support online campaigns and content creation.", "type": "Internship", "category": "Marketing", "location": "Gurgaon", "salary": "₹10k/month", "company": "ClickBuzz", "experience": "Fresher"},
-    {"id": 38, "title": "SEO Specialist", "description": "Improve website rankings and traffic.", "type": "Full Time", "category": "Marketing", "location": "Jaipur", "salary": "₹5-7 LPA", "company": "RankFirst", "experience": "2-4 years"},
-    {"id": 39, "title": "Video Editor", "description": "Edit and produce video content.", "type": "Contract", "category": "Media", "location": "Mumbai", "salary": "₹6-8 LPA", "company": "FrameCut", "experience": "1-3 years"},
-    {"id": 40, "title": "UI Designer", "description": "Design user interfaces for web and mobile.", "type": "Full Time", "category": "Design", "location": "Bangalore", "salary": "₹10-12 LPA", "company": "PixelEdge", "experience": "3-5 years"},
-    {"id": 41, "title": "Customer Support Executive", "description": "Handle customer inquiries and support.", "type": "Full Time", "category": "Support", "location": "Ahmedabad", "salary": "₹3.5-5 LPA", "company": "HelpDeskPro", "experience": "0-2 years"},
-    {"id": 42, "title": "Finance Analyst", "description": "Analyze financial performance and reports.", "type": "Full Time", "category": "Finance", "location": "Kolkata", "salary": "₹8-10 LPA", "company": "FinSharp", "experience": "2-4 years"},
-    {"id": 43, "title": "Legal Associate", "description": "Assist in drafting and reviewing legal documents.", "type": "Full Time", "category": "Legal", "location": "Delhi", "salary": "₹7-9 LPA", "company": "LawBridge", "experience": "2-4 years"},
-    {"id": 44, "title": "Business Analyst", "description": "Bridge business needs and tech solutions.", "type": "Full Time", "category": "Analysis", "location": "Hyderabad", "salary": "₹9-11 LPA", "company": "BizIntel", "experience": "3-5 years"},
-    {"id": 45, "title": "Systems Engineer", "description": "Maintain and improve IT infrastructure.", "type": "Full Time", "category": "Infrastructure", "location": "Chandigarh", "salary": "₹6-8 LPA", "company": "InfraTech", "experience": "3-6 years"},
-    {"id": 46, "title": "Robotics Engineer", "description": "Develop robotic automation systems.", "type": "Full Time", "category": "Engineering", "location": "Pune", "salary": "₹14-18 LPA", "company": "RoboCore", "experience": "5+ years"},
-    {"id": 47, "title": "IT Support Specialist", "description": "Troubleshoot and resolve IT issues.", "type": "Full Time", "category": "Support", "location": "Nagpur", "salary": "₹4.5-6 LPA", "company": "FixTech", "experience": "1-3 years"},
-    {"id": 48, "title": "Intern - HR & Admin", "description": "Support HR ops and documentation.", "type": "Internship", "category": "HR", "location": "Jaipur", "salary": "₹1.8-2.2 LPA", "company": "TeamCore", "experience": "Fresher"},
-    {"id": 49, "title": "UX Researcher", "description": "Conduct user studies and usability tests.", "type": "Full Time", "category": "Design", "location": "Remote", "salary": "₹9-12 LPA", "company": "UserLab", "experience": "2-4 years"},
-    {"id": 50, "title": "Salesforce Developer", "description": "Develop custom Salesforce solutions.", "type": "Full Time", "category": "CRM", "location": "Mumbai", "salary": "₹13-16 LPA", "company": "CRMWorld", "experience": "5+ years"}
-]
-
-
-
-def get_hot_job_by_id(hot_id):
-    """Helper to find hot job by ID from hot_jobs list."""
-    for job in hot_jobs:
-        if job["id"] == hot_id:
-            return job
-    return None
+# Query args that change what the home page lists (everything else is ignored for caching)
+LISTING_ARGS = ('q', 'sort', 'min_salary', 'max_salary', 'experience', 'after', 'before')
+listing_cache = ListingCache(key_args=LISTING_ARGS)
 
 
-# ===================
-# Helpers
-# ===================
+# Sort options for job listings: (sort key columns, descending, rows excluded from the order)
+JOB_SORTS = {
+    'newest': ((Job.id,), True, None),
+    'salary_desc': ((Job.salary_max, Job.id), True, Job.salary_max.is_(None)),
+    'salary_asc': ((Job.salary_min, Job.id), False, Job.salary_min.is_(None)),
+}
 
-def login_required(f):
-    """Decorator to protect routes for logged-in users only."""
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        if 'user_id' not in session:
-            return redirect(url_for('login'))  # Redirect unauthorized users to login
-        return f(*args, **kwargs)
-    return decorated
+
+def range_arg(args, name, type, maximum):
+    """
+    Numeric query arg, or None if it is missing, malformed, not finite (inf, nan)
+    or outside 0..maximum, so user input can never overflow the SQL bind.
+    """
+    value = args.get(name, type=type)
+    if value is None or not math.isfinite(value) or not 0 <= value <= maximum:
+        return None
+    return value
+
+
+def filter_jobs(query, min_salary=None, max_salary=None, experience=None):
+    """
+    Apply salary (LPA) and experience (years) range filters; all use the indexed numeric columns.
+    A job matches when its range overlaps the requested one.
+    """
+    if min_salary is not None:
+        query = query.filter(Job.salary_max >= int(min_salary * LAKH))
+    if max_salary is not None:
+        query = query.filter(Job.salary_min <= int(max_salary * LAKH))
+    if experience is not None:
+        query = query.filter(Job.experience_min <= experience,
+                             (Job.experience_max >= experience) | Job.experience_max.is_(None))
+    return query
+
+
+def paginate_jobs(query, sort, after=None, before=None):
+    """One page of jobs in the given JOB_SORTS order."""
+    columns, descending, excluded = JOB_SORTS[sort]
+    if excluded is not None:
+        # Jobs whose salary could not be parsed have no place in a pay ordering
+        query = query.filter(~excluded)
+    return keyset_paginate(query, columns, current_app.config['JOBS_PER_PAGE'],
+                           after=after, before=before, descending=descending)
+
+
+def search_jobs(search_query, query, sort=None, after=None, before=None):
+    """Return one page of jobs matching the search query, most relevant first unless sorted."""
+    match = build_match_expression(search_query)
+    if match:
+        ranked = ranked_matches(match)
+        matched = query.join(ranked, ranked.c.job_id == Job.id)
+        try:
+            if sort:
+                return paginate_jobs(matched, sort, after=after, before=before)
+            return keyset_paginate(matched, (ranked.c.score, Job.id), current_app.config['JOBS_PER_PAGE'],
+                                   after=after, before=before, descending=False)
+        except OperationalError:
+            # Search index missing (e.g. database not initialized yet); fall back to a scan
+            query.session.rollback()
+    # Filter jobs by title, company, or location matching search query (case-insensitive)
+    query = query.filter(
+        Job.title.ilike(f'%{search_query}%') |
+        Job.company.ilike(f'%{search_query}%') |
+        Job.location.ilike(f'%{search_query}%')
+    )
+    return paginate_jobs(query, sort or 'newest', after=after, before=before)
+
+
+@bp.app_template_global()
+def url_with_args(base_args=None, **params):
+    """
+    Current URL with the given query args replaced; None removes an arg.
+    ``base_args`` replaces the request's own query args (cached pages pass their normalized args).
+    """
+    args = dict(request.args.to_dict() if base_args is None else base_args)
+    for key, value in params.items():
+        if value is None:
+            args.pop(key, None)
+        else:
+            args[key] = value
+    return url_for(request.endpoint, **(request.view_args or {}), **args)
 
 
 # ===================
 # Routes
 # ===================
 
-@app.route('/')
+@bp.route('/')
 def home():
     """Home page showing job listings, supports search query filtering."""
-    search_query = request.args.get('q', '').strip().lower()
-    if search_query:
-        # Filter jobs by title, company, or location matching search query (case-insensitive)
-        jobs = Job.query.filter(
-            Job.title.ilike(f'%{search_query}%') |
-            Job.company.ilike(f'%{search_query}%') |
-            Job.location.ilike(f'%{search_query}%')
-        ).order_by(Job.id.desc()).all()
-    else:
-        # Show all jobs sorted by newest first
-        jobs = Job.query.order_by(Job.id.desc()).all()
-    return render_template('home.html', jobs=jobs, search_query=search_query)
-
-
-@app.route('/about')
+    anonymous = 'user_id' not in session
+    # Cached output must depend only on the cache key, so everything below reads these, not request.args
+    listing_args = MultiDict(listing_cache.normalize_args(request.args))
+    if anonymous:
+        # Anonymous pages are identical for everyone, so serve the whole page from cache
+        page_key = listing_cache.make_key('page', listing_args)
+        cached_page = listing_cache.get(page_key)
+        if cached_page is not None:
+            return cached_page
+
+    search_query = listing_args.get('q', '')
+    sort = listing_args.get('sort')
+    if sort not in JOB_SORTS:
+        sort = None
+    listings_key = listing_cache.make_key('listings', listing_args)
+    listings = listing_cache.get(listings_key)
+    if listings is None:
+        after = decode_cursor(listing_args.get('after'))
+        before = decode_cursor(listing_args.get('before'))
+        query = filter_jobs(
+            read_session().query(Job),
+            min_salary=range_arg(listing_args, 'min_salary', float, MAX_SALARY_FILTER_LPA),
+            max_salary=range_arg(listing_args, 'max_salary', float, MAX_SALARY_FILTER_LPA),
+            experience=range_arg(listing_args, 'experience', int, MAX_EXPERIENCE_FILTER_YEARS),
+        )
+        if search_query:
+            page = search_jobs(search_query, query, sort=sort, after=after, before=before)
+        else:
+            # Show all jobs sorted by newest first (or by pay), one keyset page at a time
+            page = paginate_jobs(query, sort or 'newest', after=after, before=before)
+        listings = render_template('_job_listings.html', jobs=page.items, page=page, listing_args=listing_args)
+        listing_cache.set(listings_key, listings)
+
+    html = render_template('home.html', listings=listings, search_query=search_query, sort=sort,
+                           listing_args=listing_args)
+    if anonymous:
+        listing_cache.set(page_key, html)
+    return html
+
+
+@bp.route('/about')
 def about():
     """About page."""
     return render_template('about.html')
 
 
-@app.route('/register', methods=['GET', 'POST'])
+@bp.route('/register', methods=['GET', 'POST'])
 def register():
     """User registration page. Handles form submission."""
     if request.method == 'POST':
@@ -159,7 +227,7 @@ def register():
         if existing_user:
             return '⚠️ Email already registered.'
         # Hash password and create new user with form data
-        hashed_pw = generate_password_hash(request.form['password'])
+        hashed_pw = password_hasher.hash(request.form['password'])
         new_user = User(
             username=request.form['username'],
             email=request.form['email'],
@@ -173,25 +241,33 @@ def register():
             # Handle race conditions for unique constraints
             db.session.rollback()
             return '⚠️ Username or email already exists.'
-        return redirect(url_for('login'))
+        return redirect(url_for('main.login'))
     return render_template('register.html')
 
 
-@app.route('/login', methods=['GET', 'POST'])
+@bp.route('/login', methods=['GET', 'POST'])
 def login():
     """User login page. Authenticates and creates session."""
     if request.method == 'POST':
         user = User.query.filter_by(username=request.form['username']).first()
-        if user and check_password_hash(user.password, request.form['password']):
+        if user and password_hasher.verify(user.password, request.form['password']):
+            if password_hasher.needs_rehash(user.password):
+                # Stored with older hash settings: upgrade now that we have the plain password, but only
+                # if a pool process is idle; under load keep the old hash and upgrade on a later login
+                try:
+                    user.password = password_hasher.hash(request.form['password'], idle_only=True)
+                    db.session.commit()
+                except HashingBusy:
+                    pass
             # Successful login, save user info in session
             session['user_id'] = user.id
             session['role'] = user.role
-            return redirect(url_for('dashboard'))
+            return redirect(url_for('main.dashboard'))
         return '❌ Invalid username or password.'
     return render_template('login.html')
 
 
-@app.route('/dashboard')
+@bp.route('/dashboard')
 @login_required
 def dashboard():
     """Dashboard page. Shows data based on user role."""
@@ -199,30 +275,47 @@ def dashboard():
     user_id = session.get('user_id', None)
 
     if not role or not user_id:
-        return redirect(url_for('login'))
+        return redirect(url_for('main.login'))
+    reads = read_session()
 
     if role == 'employer':
         # For employer show jobs they posted
-        jobs = Job.query.filter_by(employer_id=user_id).all()
+        jobs = reads.query(Job).filter_by(employer_id=user_id).all()
         return render_template('dashboard.html', jobs=jobs)
     
     elif role == 'jobseeker':
         # For jobseeker show applications with eager loading jobs to avoid extra queries
-        applications = Application.query.options(joinedload(Application.job)).filter_by(user_id=user_id).all()
+        applications = reads.query(Application).options(joinedload(Application.job)).filter_by(user_id=user_id).all()
         return render_template('dashboard.html', applications=applications)
     
     elif role == 'admin':
         # For admin show all users and all jobs
-        users = User.query.all()
-        jobs = Job.query.all()
-        return render_template('dashboard.html', users=users, jobs=jobs)
+        user_count = reads.query(db.func.count(User.id)).scalar()
+        job_count = reads.query(db.func.count(Job.id)).scalar()
+        if request.args.get('stream') == '1':
+            # Stream the full listings; rows are fetched in batches while the page renders
+            users = reads.query(User).order_by(User.id).yield_per(500)
+            jobs = reads.query(Job).order_by(Job.id.desc()).yield_per(500)
+            return current_app.response_class(stream_template(
+                'dashboard.html', users=users, jobs=jobs, user_count=user_count,
+                job_count=job_count, streaming=True))
+        per_page = current_app.config['ADMIN_PER_PAGE']
+        user_page = keyset_paginate(reads.query(User), (User.id,), per_page, descending=False,
+                                    after=decode_cursor(request.args.get('users_after')),
+                                    before=decode_cursor(request.args.get('users_before')))
+        job_page = keyset_paginate(reads.query(Job), (Job.id,), per_page,
+                                   after=decode_cursor(request.args.get('jobs_after')),
+                                   before=decode_cursor(request.args.get('jobs_before')))
+        return render_template('dashboard.html', users=user_page.items, jobs=job_page.items,
+                               user_page=user_page, job_page=job_page,
+                               user_count=user_count, job_count=job_count)
     
     else:
         # Unknown roles are forbidden
         abort(403)
 
 
-@app.route('/delete-job/<int:job_id>', methods=['POST'])
+@bp.route('/delete-job/<int:job_id>', methods=['POST'])
 @login_required
 def delete_job(job_id):
     """Allows employers to delete their jobs."""
@@ -231,13 +324,18 @@ def delete_job(job_id):
     job = Job.query.get_or_404(job_id)
     if job.employer_id != session['user_id']:
         abort(403)  # Forbidden if not job owner
+    # Cascade to applications with one set-based DELETE (uses the job_id index)
+    db.session.execute(db.delete(Application).where(Application.job_id == job.id))
     db.session.delete(job)
+    unindex_job(db.session, job.id)
+    db.session.merge(DeletedJob(id=job.id, deleted_at=utcnow()))  # merge: SQLite may reuse a deleted id
     db.session.commit()
+    listing_cache.invalidate()
     flash('Job deleted successfully!', 'success')
-    return redirect(url_for('dashboard'))
+    return redirect(url_for('main.dashboard'))
 
 
-@app.route('/post-job', methods=['GET', 'POST'])
+@bp.route('/post-job', methods=['GET', 'POST'])
 @login_required
 def post_job():
     """Allows employers to post new jobs."""
@@ -250,16 +348,21 @@ def post_job():
             location=request.form['location'],
             salary=request.form['salary'],
             description=request.form['description'],
+            experience=request.form.get('experience') or None,
             employer_id=session['user_id']
         )
+        set_job_ranges(job)
         db.session.add(job)
+        db.session.flush()  # Assigns job.id for the search index
+        index_job(db.session, job)
         db.session.commit()
+        listing_cache.invalidate()
         flash('Job posted successfully!', 'success')
-        return redirect(url_for('dashboard'))
+        return redirect(url_for('main.dashboard'))
     return render_template('post_job.html')
 
 
-@app.route('/apply/<job_id>', methods=['GET', 'POST'])
+@bp.route('/apply/<job_id>', methods=['GET', 'POST'])
 def apply_job(job_id):
     """
     Job application route supports two cases:
@@ -272,52 +375,196 @@ def apply_job(job_id):
             hot_id = int(job_id.replace("hot-", ""))
         except:
             flash("Invalid hot job selected.", "warning")
-            return redirect(url_for('home'))
-        job = get_hot_job_by_id(hot_id)
+            return redirect(url_for('main.home'))
+        job = hot_job_catalog.get(hot_id)
         if not job:
             flash("Hot job not found.", "warning")
-            return redirect(url_for('home'))
+            return redirect(url_for('main.home'))
         if request.method == 'POST':
             if 'user_id' not in session or session['role'] != 'jobseeker':
-                return redirect(url_for('login'))
+                return redirect(url_for('main.login'))
             flash('Application submitted for hot job! (Note: hot jobs are demo only)', 'success')
-            return redirect(url_for('dashboard'))
+            return redirect(url_for('main.dashboard'))
         return render_template('apply.html', job=job, is_hot=True)
 
     # Database job application case
     job = Job.query.get(int(job_id))
     if not job:
         flash("Job not found.", "warning")
-        return redirect(url_for('home'))
+        return redirect(url_for('main.home'))
     if request.method == 'POST':
         if 'user_id' not in session or session['role'] != 'jobseeker':
-            return redirect(url_for('login'))
-        # Prevent duplicate applications
-        existing_application = Application.query.filter_by(job_id=job.id, user_id=session['user_id']).first()
-        if existing_application:
+            return redirect(url_for('main.login'))
+        # Insert-or-ignore against the unique index: duplicates are detected by the database
+        if application_writer.enabled:
+            created = application_writer.submit(job.id, session['user_id'])
+        else:
+            created = submit_application(db.session, job.id, session['user_id'])
+            db.session.commit()
+        if not created:
             flash('You have already applied to this job.', 'warning')
-            return redirect(url_for('dashboard'))
-        application = Application(job_id=job.id, user_id=session['user_id'])
-        db.session.add(application)
-        db.session.commit()
+            return redirect(url_for('main.dashboard'))
         flash('Application submitted successfully!', 'success')
-        return redirect(url_for('dashboard'))
+        return redirect(url_for('main.dashboard'))
     return render_template('apply.html', job=job, is_hot=False)
 
 
-@app.route('/logout')
+@bp.route('/jobs/import', methods=['POST'])
+@login_required
+def import_jobs_upload():
+    """Bulk-create jobs for the logged-in employer from an uploaded CSV or JSONL file."""
+    if session.get('role') != 'employer':
+        abort(403)
+    upload = request.files.get('file')
+    wants_json = request.accept_mimetypes.best_match(['text/html', 'application/json']) == 'application/json'
+    if not upload or not upload.filename:
+        if wants_json:
+            return jsonify(error='No file uploaded.'), 400
+        flash('Please choose a CSV or JSONL file to import.', 'warning')
+        return redirect(url_for('main.post_job'))
+    fmt = request.form.get('format') or detect_format(upload.filename)
+    if fmt not in BULK_FORMATS:
+        abort(400)
+    # The upload is read line by line from werkzeug's spooled file, never fully in memory
+    report = import_jobs(db.session, Job, iter_records(upload.stream, fmt), session['user_id'],
+                         batch_size=current_app.config['IMPORT_BATCH_SIZE'])
+    if report.imported:
+        listing_cache.invalidate()
+    if wants_json:
+        return jsonify(report.to_dict())
+    flash(f'Imported {report.imported} jobs.', 'success')
+    if report.errors:
+        details = '; '.join(f'line {line_no}: {message}' for line_no, message in report.errors[:5])
+        flash(f'{len(report.errors)} rows were skipped ({details}).', 'warning')
+    return redirect(url_for('main.dashboard'))
+
+
+@bp.route('/export/<any(jobs, applications):table>.<any(csv, jsonl):fmt>')
+@login_required
+def export_table(table, fmt):
+    """Stream jobs or applications as CSV/JSONL. Admins get everything, employers their own jobs."""
+    role = session.get('role')
+    if role == 'admin':
+        employer_id = None
+    elif role == 'employer':
+        employer_id = session['user_id']
+    else:
+        abort(403)
+    mimetype = 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+    response = current_app.response_class(stream_with_context(export_chunks(table, fmt, employer_id)),
+                                  mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename={table}.{fmt}'
+    return response
+
+
+@bp.route('/api/hot-jobs')
+def hot_jobs_api():
+    """
+    Hot jobs catalog as JSON, with facet indexes for client-side filtering.
+    Optional facet query args (category, location, type, experience) filter server-side.
+    """
+    criteria = {facet: request.args.get(facet) for facet in HOT_JOB_FACETS if request.args.get(facet)}
+    if not criteria:
+        # Full catalog is immutable: serve the prebuilt, precompressed body
+        return payload_response(hot_job_catalog.payload)
+    jobs = hot_job_catalog.filter(**criteria)
+    return jsonify(hot_job_catalog.as_dict(jobs))
+
+
+@bp.route('/api/v1/jobs')
+def jobs_feed():
+    """
+    Read-only job feed for aggregators, oldest change first. Args: format (json or ndjson),
+    updated_since (ISO 8601, inclusive; also lists deleted jobs), after (cursor from the
+    previous page), limit.
+    """
+    fmt = request.args.get('format')
+    negotiated = fmt is None
+    if negotiated:
+        fmt = 'ndjson' if request.accept_mimetypes.best == FEED_FORMATS['ndjson'] else 'json'
+    if fmt not in FEED_FORMATS:
+        return jsonify(error=f'format must be one of: {", ".join(FEED_FORMATS)}'), 400
+    since = request.args.get('updated_since')
+    updated_since = parse_timestamp(since) if since else None
+    if since and updated_since is None:
+        return jsonify(error='updated_since must be an ISO 8601 timestamp'), 400
+    limit = request.args.get('limit', current_app.config['FEED_PAGE_SIZE'], type=int)
+    limit = max(1, min(limit, current_app.config['FEED_MAX_PAGE_SIZE']))
+    args = dict(request.args.items(), format=fmt, limit=str(limit))
+
+    feed_key = listing_cache.make_key('feed', args, key_args=FEED_ARGS)
+    cached = listing_cache.get(feed_key)
+    if cached is None:
+        reads = read_session()
+        after = decode_cursor(request.args.get('after'))
+        if after is not None:
+            cursor_time = parse_timestamp(str(after[0]))
+            after = (cursor_time, *after[1:]) if cursor_time else None
+        query = reads.query(Job).filter(Job.updated_at.is_not(None))
+        if updated_since is not None:
+            updated_since -= timedelta(seconds=current_app.config['FEED_SYNC_OVERLAP'])
+            query = query.filter(Job.updated_at >= updated_since)
+        page = keyset_paginate(query, (Job.updated_at, Job.id), limit, after=after, descending=False)
+        if updated_since is not None:
+            # Incremental sync: deletions since then, interleaved with the updates in change order
+            deletions = keyset_paginate(reads.query(DeletedJob).filter(DeletedJob.deleted_at >= updated_since),
+                                        (DeletedJob.deleted_at, DeletedJob.id), limit, after=after,
+                                        descending=False)
+            page = merge_changes(page, deletions, limit)
+        # Cache the next cursor alongside the body so NDJSON hits can still send the Link header
+        cached = f'{page.next_cursor or ""}\n' + render_feed(page.items, fmt, page.next_cursor)
+        listing_cache.set(feed_key, cached)
+
+    next_cursor, body = cached.split('\n', 1)
+    payload = StaticPayload(body.encode('utf-8'), FEED_FORMATS[fmt], gzip_level=6, brotli_quality=5)
+    response = payload_response(payload, max_age=current_app.config['FEED_MAX_AGE'])
+    if negotiated:
+        response.vary.add('Accept')  # The same URL is JSON or NDJSON depending on Accept
+    if next_cursor:
+        response.headers['Link'] = f'<{url_with_args(after=next_cursor, limit=limit)}>; rel="next"'
+    return response
+
+
+@bp.route('/_cache/stats')
+@login_required
+def cache_stats():
+    """Listing cache hit/miss counters for this worker (admin only)."""
+    if session.get('role') != 'admin':
+        abort(403)
+    return jsonify(listing_cache.stats())
+
+
+@bp.route('/_metrics')
+@login_required
+def metrics():
+    """Per-route latency histograms and SQL/render totals for this worker (admin only)."""
+    if not profiler.enabled:
+        abort(404)
+    if session.get('role') != 'admin':
+        abort(403)
+    return jsonify(routes=profiler.snapshot(), listing_cache=listing_cache.stats())
+
+
+@bp.app_errorhandler(HashingBusy)
+@bp.app_errorhandler(WriterBusy)
+def server_busy(error):
+    """Too many logins/registrations or applications queued: ask the client to retry."""
+    return '⚠️ Server is busy, please try again in a moment.', 503, {'Retry-After': '1'}
+
+
+@bp.route('/logout')
 def logout():
     """Logs out the current user by clearing the session."""
     session.clear()
-    return redirect(url_for('home'))
+    return redirect(url_for('main.home'))
 
 
-@app.route('/edit-job/<int:job_id>', methods=['GET', 'POST'])
+@bp.route('/edit-job/<int:job_id>', methods=['GET', 'POST'])
 @login_required
 def edit_job(job_id):
     """Allows an employer to edit a job they posted."""
     if session['role'] != 'employer':
-        return redirect(url_for('login'))
+        return redirect(url_for('main.login'))
     job = Job.query.get_or_404(job_id)
     if job.employer_id != session['user_id']:
         return "❌ Unauthorized access", 403
@@ -328,15 +575,189 @@ def edit_job(job_id):
         job.salary = request.form['salary']
         job.location = request.form['location']
         job.company = request.form['company']
+        job.experience = request.form.get('experience') or None
+        set_job_ranges(job)
+        job.updated_at = utcnow()
+        index_job(db.session, job)
         db.session.commit()
+        listing_cache.invalidate()
         flash('Job updated successfully!', 'success')   # <-- Add this line
-        return redirect(url_for('dashboard'))
+        return redirect(url_for('main.dashboard'))
     # Show form with current job data for editing
     return render_template('edit_job.html', job=job)
 
 
+# ===================
+# CLI Commands
+# ===================
+
+@bp.cli.command('rebuild-search-index')
+def rebuild_search_index_command():
+    """Rebuild the full-text search index from all existing jobs."""
+    count = rebuild_search_index(db.session)
+    db.session.commit()
+    click.echo(f'Indexed {count} jobs.')
+
+
+@bp.cli.command('backfill-job-ranges')
+def backfill_job_ranges_command():
+    """Parse salary/experience text of all existing jobs into the numeric range columns."""
+    click.echo(f'Updated {backfill_job_ranges()} jobs.')
+
+
+def backfill_job_ranges(batch_size=1000):
+    """Recompute numeric ranges for every job in id-ordered batches. Returns the job count."""
+    count = 0
+    last_id = 0
+    while True:
+        rows = (db.session.query(Job.id, Job.salary, Job.experience)
+                .filter(Job.id > last_id).order_by(Job.id).limit(batch_size).all())
+        if not rows:
+            break
+        mappings = []
+        for job_id, salary_text, experience_text in rows:
+            salary = parse_salary(salary_text) or (None, None)
+            experience = parse_experience(experience_text) or (None, None)
+            mappings.append({
+                'id': job_id,
+                'salary_min': salary[0], 'salary_max': salary[1],
+                'experience_min': experience[0], 'experience_max': experience[1],
+            })
+        db.session.bulk_update_mappings(Job, mappings)
+        db.session.commit()
+        count += len(rows)
+        last_id = rows[-1][0]
+    return count
+
+
+@bp.cli.command('reconcile-applicant-counts')
+@click.option('--delete-orphans', is_flag=True, help='Also delete applications whose job no longer exists.')
+def reconcile_applicant_counts_command(delete_orphans):
+    """Recompute every job's applicant_count from the application table."""
+    if delete_orphans:
+        click.echo(f'Deleted {delete_orphan_applications()} orphaned applications.')
+    click.echo(f'Corrected {reconcile_applicant_counts()} jobs.')
+
+
+def delete_orphan_applications():
+    """Delete applications left behind by jobs deleted before the cascade existed. Returns the row count."""
+    result = db.session.execute(
+        db.delete(Application).where(Application.job_id.is_(None) | Application.job_id.not_in(db.select(Job.id))),
+        execution_options={'synchronize_session': False})
+    db.session.commit()
+    return result.rowcount
+
+
+def reconcile_applicant_counts():
+    """Reset applicant_count from one GROUP BY over applications. Returns how many jobs changed."""
+    counts = (db.select(Application.job_id, db.func.count().label('applicants'))
+              .group_by(Application.job_id).subquery())
+    # UPDATE ... FROM the grouped counts, touching only jobs whose counter drifted
+    changed = db.session.execute(
+        db.update(Job)
+        .where(Job.id == counts.c.job_id, Job.applicant_count != counts.c.applicants)
+        .values(applicant_count=counts.c.applicants),
+        execution_options={'synchronize_session': False}).rowcount
+    # Jobs without any applications are not in the grouped counts
+    changed += db.session.execute(
+        db.update(Job)
+        .where(Job.applicant_count != 0,
+               Job.id.not_in(db.select(Application.job_id).where(Application.job_id.is_not(None))))
+        .values(applicant_count=0),
+        execution_options={'synchronize_session': False}).rowcount
+    db.session.commit()
+    return changed
+
+
+@bp.cli.command('import-jobs')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--employer-id', type=int, required=True, help='User id of the employer that owns the jobs.')
+@click.option('--format', 'fmt', type=click.Choice(BULK_FORMATS), help='Defaults to the file extension.')
+@click.option('--batch-size', type=int, default=None, help='Rows per transaction.')
+def import_jobs_command(path, employer_id, fmt, batch_size):
+    """Bulk-import jobs from a CSV or JSONL file."""
+    employer = db.session.get(User, employer_id)
+    if not employer or employer.role != 'employer':
+        raise click.BadParameter('Not an employer account.', param_hint='--employer-id')
+    with open(path, 'rb') as stream:
+        report = import_jobs(db.session, Job, iter_records(stream, fmt or detect_format(path)), employer_id,
+                             batch_size=batch_size or current_app.config['IMPORT_BATCH_SIZE'])
+    if report.imported:
+        listing_cache.invalidate()
+    for line_no, message in report.errors:
+        click.echo(f'line {line_no}: {message}', err=True)
+    click.echo(f'Imported {report.imported} jobs, {len(report.errors)} rows failed.')
+
+
+@bp.cli.command('export-jobs')
+@click.option('--format', 'fmt', type=click.Choice(BULK_FORMATS), default='csv')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), default='-', help='File path, or - for stdout.')
+def export_jobs_command(fmt, output):
+    """Export all jobs as CSV or JSONL."""
+    with click.open_file(output, 'w', encoding='utf-8') as out:
+        for chunk in export_chunks('jobs', fmt):
+            out.write(chunk)
+
+
+@bp.cli.command('export-applications')
+@click.option('--format', 'fmt', type=click.Choice(BULK_FORMATS), default='csv')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), default='-', help='File path, or - for stdout.')
+def export_applications_command(fmt, output):
+    """Export all applications as CSV or JSONL."""
+    with click.open_file(output, 'w', encoding='utf-8') as out:
+        for chunk in export_chunks('applications', fmt):
+            out.write(chunk)
+
+
+def init_db(app):
+    """Create database tables, add columns/indexes missing from older databases, and build the search index."""
+    # Workers booting at once would otherwise race on the same ALTER TABLEs and backfills
+    with app.app_context(), schema_lock():
+        db.create_all(bind_key=None)  # The read bind shares these tables
+        application_indexes = {index['name'] for index in db.inspect(db.engine).get_indexes('application')}
+        if APPLICATION_UNIQUE_INDEX not in application_indexes:
+            # Older databases may hold duplicate applications, which would block the unique index
+            deduplicated = dedupe_applications(db.session)
+            db.session.commit()
+        else:
+            deduplicated = 0
+        added_columns = upgrade_schema(db.engine, db.metadata)
+        ensure_search_index(db.session)
+        db.session.commit()
+        # Columns were just added to an existing database: fill them once
+        if 'job.salary_min' in added_columns:
+            backfill_job_ranges()
+        if 'job.applicant_count' in added_columns or deduplicated:
+            reconcile_applicant_counts()
+        if 'job.updated_at' in added_columns:
+            # Unknown history: treat every existing job as changed now, so feed clients pick it up
+            db.session.execute(db.update(Job).where(Job.updated_at.is_(None)).values(updated_at=utcnow()))
+            db.session.commit()
+
+
+def create_app(config=None):
+    """
+    Application factory. Settings come from config.Config, then FLASK_* environment
+    variables, then the ``config`` mapping. Creates missing tables on startup.
+
+    Run with ``flask --app app run`` or ``gunicorn 'app:create_app()'``.
+    """
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config.from_prefixed_env()
+    app.config.update(config or {})
+    if not app.config['CACHE_PATH']:
+        app.config['CACHE_PATH'] = os.path.join(app.instance_path, 'listing_cache.db')
+    init_database(app)
+    listing_cache.init_app(app)
+    password_hasher.init_app(app)
+    application_writer.init_app(app)
+    profiler.init_app(app)
+    app.register_blueprint(bp)
+    init_db(app)
+    return app
+
+
 if __name__ == '__main__':
-    # Create database tables if missing, then run development server
-    with app.app_context():
-        db.create_all()
-    app.run(debug=True)
+    # Run development server
+    create_app().run(debug=True)
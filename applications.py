@@ -0,0 +1,182 @@
+"""
+Job application submission.
+
+``submit_application`` is an idempotent insert: the unique (job_id, user_id)
+index turns a repeat click into a no-op, and the job's applicant counter only
+moves when a row was actually inserted. No read-before-write, no race.
+
+``ApplicationWriter`` optionally coalesces submissions from many request
+threads into one transaction every few milliseconds (group commit), so a burst
+on a popular job takes the SQLite write lock once per batch instead of once
+per click. Each caller still waits for its own result, so nothing is
+acknowledged before it is committed and "already applied" stays exact. A
+caller that waits longer than ``APPLY_WRITE_TIMEOUT`` gets ``WriterBusy``
+(503); its application is withdrawn unless the writer already took it, and
+a retry is idempotent either way.
+
+Batches only form from requests handled concurrently by one process, i.e.
+threaded workers (``gunicorn -k gthread --threads N``). With sync workers
+each batch holds a single application and only adds
+``APPLY_FLUSH_INTERVAL_MS`` of latency, so leave write-behind off there.
+"""
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, TimeoutError as FuturesTimeout
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from database import db
+from models import Application, Job
+
+APPLICATION_UNIQUE_INDEX = 'uq_application_job_user'
+
+
+class WriterBusy(Exception):
+    """Raised when the write-behind queue is full or too slow; the caller should retry later."""
+
+
+def _insert_ignoring_duplicates():
+    return sqlite_insert(Application).on_conflict_do_nothing(index_elements=['job_id', 'user_id'])
+
+
+def _bump_applicant_counts(session, added_per_job):
+    # Core table update: one executemany of "count = count + n" per job
+    jobs = Job.__table__
+    session.execute(
+        update(jobs).where(jobs.c.id == bindparam('job')).values(
+            applicant_count=jobs.c.applicant_count + bindparam('added')),
+        [{'job': job_id, 'added': added} for job_id, added in added_per_job.items()]
+    )
+
+
+def submit_application(session, job_id, user_id):
+    """
+    Record an application unless this user already applied to this job.
+    Returns True if it was new. The caller commits.
+    """
+    result = session.execute(_insert_ignoring_duplicates().values(job_id=job_id, user_id=user_id))
+    if result.rowcount != 1:
+        return False
+    _bump_applicant_counts(session, {job_id: 1})
+    return True
+
+
+def dedupe_applications(session):
+    """Delete repeated (job_id, user_id) applications, keeping the oldest. Returns the row count."""
+    first_ids = (db.select(db.func.min(Application.id))
+                 .group_by(Application.job_id, Application.user_id).scalar_subquery())
+    result = session.execute(db.delete(Application).where(Application.id.not_in(first_ids)),
+                             execution_options={'synchronize_session': False})
+    return result.rowcount
+
+
+class ApplicationWriter:
+    """Flask extension that batches application inserts on a background thread."""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.enabled = False
+        self.flush_interval = 0.005
+        self.batch_size = 200
+        self.queue_size = 10000
+        self.timeout = 10
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config['APPLY_WRITE_BEHIND']
+        self.flush_interval = app.config['APPLY_FLUSH_INTERVAL_MS'] / 1000
+        self.batch_size = app.config['APPLY_BATCH_SIZE']
+        self.queue_size = app.config['APPLY_QUEUE_SIZE']
+        self.timeout = app.config['APPLY_WRITE_TIMEOUT']
+
+    def _ensure_started(self):
+        # Started lazily in each web worker process; threads do not survive a fork
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+                self._queue = queue.Queue(maxsize=self.queue_size)
+                self._thread = threading.Thread(target=self._run, name='application-writer', daemon=True)
+                self._pid = os.getpid()
+                self._thread.start()
+
+    def submit(self, job_id, user_id):
+        """Queue an application and wait until its batch commits. Returns True if it was new."""
+        self._ensure_started()
+        future = Future()
+        try:
+            self._queue.put_nowait((job_id, user_id, future))
+        except queue.Full:
+            raise WriterBusy() from None
+        try:
+            return future.result(timeout=self.timeout)
+        except FuturesTimeout:
+            future.cancel()  # Only succeeds if the writer has not taken it yet
+            raise WriterBusy() from None
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            # Skip applications whose caller timed out and withdrew them
+            batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                with self.app.app_context():
+                    self._write(batch)
+            except Exception as exc:  # noqa: BLE001 - handed to the waiting requests
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    def _write(self, batch):
+        session = db.session
+        pairs = list(dict.fromkeys((job_id, user_id) for job_id, user_id, _ in batch))
+        try:
+            rows = session.execute(
+                _insert_ignoring_duplicates().returning(Application.job_id, Application.user_id),
+                [{'job_id': job_id, 'user_id': user_id} for job_id, user_id in pairs]
+            ).all()
+            created = {tuple(row) for row in rows}
+            if created:
+                _bump_applicant_counts(session, Counter(job_id for job_id, _ in created))
+            session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            self._write_one_by_one(session, batch)
+            return
+        answered = set()
+        for job_id, user_id, future in batch:
+            # A repeat of the same pair within one batch is a duplicate of the first
+            pair = (job_id, user_id)
+            future.set_result(pair in created and pair not in answered)
+            answered.add(pair)
+
+    def _write_one_by_one(self, session, batch):
+        # Isolate whatever made the batch fail so only its own caller sees the error
+        for job_id, user_id, future in batch:
+            try:
+                created = submit_application(session, job_id, user_id)
+                session.commit()
+                future.set_result(created)
+            except SQLAlchemyError as exc:
+                session.rollback()
+                future.set_exception(exc)
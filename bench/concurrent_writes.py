@@ -0,0 +1,170 @@
+"""
+Concurrency hammer: many processes posting jobs and applying at once against
+one SQLite file, the way several gunicorn workers would.
+
+Each worker process builds its own app with create_app() on a scratch
+database, registers an employer and a jobseeker, then interleaves job posts,
+applications and home page reads. Any 5xx response, exception or lost write
+counts as an error; the script prints a JSON report and exits non-zero if
+there were any.
+
+    python bench/concurrent_writes.py --workers 8 --iterations 50
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.stats import git_revision, percentile_ms  # noqa: E402
+
+
+def make_app(db_path, read_pool, write_behind=False):
+    from app import create_app
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
+        'DB_READ_POOL': read_pool,
+        'APPLY_WRITE_BEHIND': write_behind,
+        'CACHE_BACKEND': 'null',
+    })
+
+
+def register_and_login(client, username, role):
+    client.post('/register', data={'username': username, 'email': f'{username}@example.com',
+                                   'password': 'bench-password', 'role': role})
+    response = client.post('/login', data={'username': username, 'password': 'bench-password'})
+    if response.status_code != 302:
+        raise RuntimeError(f'Login failed for {username}: {response.status_code}')
+
+
+def worker(index, db_path, iterations, read_pool, write_behind, results):
+    from app import password_hasher
+    try:
+        run_worker(index, db_path, iterations, read_pool, write_behind, results)
+    finally:
+        # Pool processes are not daemons; stop them or this process cannot exit
+        password_hasher.shutdown()
+
+
+def run_worker(index, db_path, iterations, read_pool, write_behind, results):
+    app = make_app(db_path, read_pool, write_behind)
+    employer, seeker = app.test_client(), app.test_client()
+    latencies, statuses, errors = [], {}, []
+    posted = applied = 0
+    try:
+        register_and_login(employer, f'bench_employer_{index}', 'employer')
+        register_and_login(seeker, f'bench_seeker_{index}', 'jobseeker')
+    except Exception as exc:  # noqa: BLE001 - reported, not raised
+        results.put({'worker': index, 'errors': [repr(exc)], 'latencies': [], 'statuses': {},
+                     'posted': 0, 'applied': 0})
+        return
+    applied_to = set()
+    rng = random.Random(index)
+    for i in range(iterations):
+        for action in ('post', 'apply', 'read'):
+            started = time.perf_counter()
+            try:
+                if action == 'post':
+                    response = employer.post('/post-job', data={
+                        'title': f'Bench job {index}-{i}', 'company': 'Bench Co', 'location': 'Remote',
+                        'salary': '10-12 LPA', 'experience': '2-4 years', 'description': 'Load test posting',
+                    })
+                    posted += response.status_code == 302
+                elif action == 'apply':
+                    with app.app_context():
+                        from models import Job
+                        job_ids = [row[0] for row in Job.query.with_entities(Job.id)
+                                   .order_by(Job.id.desc()).limit(50).all()]
+                    job_id = rng.choice(job_ids)
+                    response = seeker.post(f'/apply/{job_id}')
+                    if response.status_code == 302 and job_id not in applied_to:
+                        applied_to.add(job_id)
+                        applied += 1
+                else:
+                    response = employer.get('/')
+            except Exception as exc:  # noqa: BLE001 - reported, not raised
+                errors.append(f'{action}: {exc!r}')
+                continue
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code >= 500:
+                errors.append(f'{action}: HTTP {response.status_code}')
+    results.put({'worker': index, 'errors': errors, 'latencies': latencies, 'statuses': statuses,
+                 'posted': posted, 'applied': applied})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--iterations', type=int, default=25, help='Post/apply/read rounds per worker.')
+    parser.add_argument('--db', help='SQLite file to use (default: a fresh temporary file).')
+    parser.add_argument('--no-read-pool', action='store_true', help='Run reads on the primary engine.')
+    parser.add_argument('--write-behind', action='store_true', help='Batch applications (APPLY_WRITE_BEHIND).')
+    args = parser.parse_args(argv)
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix='jobportal-bench-'), 'bench.db')
+    read_pool = not args.no_read_pool
+    app = make_app(db_path, read_pool)  # Creates the schema before the workers race for it
+    with app.app_context():
+        from models import Application, Job
+        jobs_before, applications_before = Job.query.count(), Application.query.count()
+
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    started = time.perf_counter()
+    processes = [context.Process(target=worker, args=(i, db_path, args.iterations, read_pool, args.write_behind, results))
+                 for i in range(args.workers)]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - started
+
+    errors = [f"worker {r['worker']}: {e}" for r in reports for e in r['errors']]
+    with app.app_context():
+        from database import db
+        db.session.expire_all()
+        jobs_written = Job.query.count() - jobs_before
+        applications_written = Application.query.count() - applications_before
+    posted = sum(r['posted'] for r in reports)
+    applied = sum(r['applied'] for r in reports)
+    if jobs_written != posted:
+        errors.append(f'{posted} job posts succeeded but {jobs_written} jobs were written')
+    if applications_written != applied:
+        errors.append(f'{applied} applications succeeded but {applications_written} were written')
+
+    latencies = sorted(latency for r in reports for latency in r['latencies'])
+    statuses = {}
+    for r in reports:
+        for status, count in r['statuses'].items():
+            statuses[str(status)] = statuses.get(str(status), 0) + count
+    report = {
+        'revision': git_revision(),
+        'database': db_path,
+        'workers': args.workers,
+        'read_pool': read_pool,
+        'write_behind': args.write_behind,
+        'requests': len(latencies),
+        'elapsed_s': round(elapsed, 3),
+        'requests_per_s': round(len(latencies) / elapsed, 1) if elapsed else None,
+        'p50_ms': percentile_ms(latencies, 0.50),
+        'p95_ms': percentile_ms(latencies, 0.95),
+        'p99_ms': percentile_ms(latencies, 0.99),
+        'statuses': statuses,
+        'jobs_written': jobs_written,
+        'applications_written': applications_written,
+        'errors': errors[:50],
+        'error_count': len(errors),
+    }
+    print(json.dumps(report, indent=2))
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
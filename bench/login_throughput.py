@@ -0,0 +1,124 @@
+"""
+Login throughput with password hashing inline vs in the process pool.
+
+Runs a burst of concurrent logins in threads (as a threaded gunicorn worker
+would) while other threads keep loading the home page, once per mode, and
+prints a JSON report: logins per second, login latency, home page latency
+during the burst, and how many logins were shed with 503.
+
+    python bench/login_throughput.py --threads 8 --logins 200 --pool-workers 2
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.stats import latency_summary  # noqa: E402
+
+BENCH_PASSWORD = 'bench-password'
+
+
+def seed_users(app, count, method):
+    from database import db
+    from models import User
+    from werkzeug.security import generate_password_hash
+    with app.app_context():
+        if User.query.filter_by(username='bench_user_0').first():
+            return
+        stored = generate_password_hash(BENCH_PASSWORD, method)  # Same hash for all; cost is what matters
+        db.session.add_all([User(username=f'bench_user_{i}', email=f'bench_user_{i}@example.com',
+                                 password=stored, role='jobseeker') for i in range(count)])
+        db.session.commit()
+
+
+def run_mode(db_path, method, pool_workers, queue, threads, logins, readers):
+    from app import create_app, password_hasher
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
+        'CACHE_BACKEND': 'null',  # Measure real page work, not cache hits
+        'PASSWORD_HASH_METHOD': method,
+        'PASSWORD_HASH_WORKERS': pool_workers,
+        'PASSWORD_HASH_QUEUE': queue,
+    })
+    seed_users(app, threads, method)
+    if pool_workers:
+        password_hasher.verify(password_hasher.hash('warm-up'), 'warm-up')  # Start pool processes
+
+    login_latencies, page_latencies, statuses = [], [], {}
+    lock = threading.Lock()
+    remaining = iter(range(logins))
+    burst_done = threading.Event()
+
+    def login_loop(index):
+        client = app.test_client()
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            started = time.perf_counter()
+            response = client.post('/login', data={'username': f'bench_user_{index}', 'password': BENCH_PASSWORD})
+            elapsed = time.perf_counter() - started
+            with lock:
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.status_code == 302:
+                    login_latencies.append(elapsed)
+
+    def read_loop():
+        client = app.test_client()
+        while not burst_done.is_set():
+            started = time.perf_counter()
+            client.get('/')
+            with lock:
+                page_latencies.append(time.perf_counter() - started)
+
+    reader_threads = [threading.Thread(target=read_loop) for _ in range(readers)]
+    login_threads = [threading.Thread(target=login_loop, args=(i,)) for i in range(threads)]
+    for thread in reader_threads:
+        thread.start()
+    started = time.perf_counter()
+    for thread in login_threads:
+        thread.start()
+    for thread in login_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    burst_done.set()
+    for thread in reader_threads:
+        thread.join()
+    password_hasher.shutdown()
+
+    return {
+        'mode': f'pool({pool_workers})' if pool_workers else 'inline',
+        'elapsed_s': round(elapsed, 3),
+        'logins_per_s': round(len(login_latencies) / elapsed, 1),
+        'login': latency_summary(login_latencies),
+        'home_page_during_burst': latency_summary(page_latencies),
+        'statuses': {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8, help='Concurrent login threads.')
+    parser.add_argument('--logins', type=int, default=100, help='Total logins per mode.')
+    parser.add_argument('--readers', type=int, default=2, help='Threads loading the home page meanwhile.')
+    parser.add_argument('--pool-workers', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--queue', type=int, default=64, help='PASSWORD_HASH_QUEUE for the pool run.')
+    parser.add_argument('--method', default='scrypt:32768:8:1', help='Werkzeug password hash method.')
+    args = parser.parse_args(argv)
+
+    db_path = os.path.join(tempfile.mkdtemp(prefix='jobportal-bench-'), 'bench.db')
+    results = [
+        run_mode(db_path, args.method, 0, 0, args.threads, args.logins, args.readers),
+        run_mode(db_path, args.method, args.pool_workers, args.queue, args.threads, args.logins, args.readers),
+    ]
+    print(json.dumps({'method': args.method, 'threads': args.threads, 'cpus': os.cpu_count(),
+                      'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
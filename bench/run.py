@@ -0,0 +1,389 @@
+"""
+Route benchmark: drives the main pages against a seeded database and prints
+throughput, p50/p95/p99 latency and peak RSS per scenario as JSON.
+
+Two modes:
+
+* ``client`` - the Flask test client from threads in this process (no
+  network, no server; measures the app itself).
+* ``http`` - a real ``gunicorn 'app:create_app()'`` with ``--gunicorn-workers``
+  workers, loaded by ``--concurrency`` client processes over HTTP.
+
+The seeded database is copied to a scratch directory first, so write
+scenarios never change it and every run starts from the same data.
+
+Anonymous home page scenarios are mostly listing-cache hits; their results
+say so (``"listing_cache": true``). Run again with ``--no-cache`` for the
+cost of actually querying and rendering. In http mode the cache is the
+shared SQLite backend, as recommended for several gunicorn workers.
+
+    python bench/seed.py /tmp/bench.db --users 10000 --jobs 50000 --applications 100000
+    python bench/run.py /tmp/bench.db --mode client --requests 500
+    python bench/run.py /tmp/bench.db --mode http --gunicorn-workers 4 --concurrency 8 --output before.json
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlencode
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.seed import BENCH_PASSWORD, COMPANIES, LOCATIONS, SEARCH_TERMS, TITLES  # noqa: E402
+from bench.stats import REPO_ROOT, git_revision, latency_summary, peak_rss_kb  # noqa: E402
+from hot_jobs import HOT_JOBS  # noqa: E402
+
+# How many distinct accounts of each role the clients log in as
+ACCOUNTS_PER_ROLE = 50
+
+
+# ===================
+# Scenarios
+# ===================
+# Each scenario is (role to log in as or None, expected status, request builder, served from the
+# listing cache unless --no-cache).
+# A builder takes (rng, fixtures, account) and returns (method, path, form data or None).
+
+def _home(rng, fixtures, account):
+    return 'GET', '/', None
+
+
+def _home_search(rng, fixtures, account):
+    return 'GET', '/?' + urlencode({'q': rng.choice(SEARCH_TERMS)}), None
+
+
+def _dashboard(rng, fixtures, account):
+    return 'GET', '/dashboard', None
+
+
+def _apply_db(rng, fixtures, account):
+    return 'POST', f'/apply/{rng.randint(1, fixtures["max_job_id"])}', {}
+
+
+def _apply_hot(rng, fixtures, account):
+    return 'POST', f'/apply/hot-{rng.choice(fixtures["hot_job_ids"])}', {}
+
+
+def _login(rng, fixtures, account):
+    return 'POST', '/login', {'username': account, 'password': BENCH_PASSWORD}
+
+
+def _post_job(rng, fixtures, account):
+    return 'POST', '/post-job', {
+        'title': rng.choice(TITLES), 'company': rng.choice(COMPANIES), 'location': rng.choice(LOCATIONS),
+        'salary': '₹8-10 LPA', 'experience': '2-4 years', 'description': 'Benchmark posting.',
+    }
+
+
+# Read scenarios first: the writes at the end invalidate the listing cache
+SCENARIOS = {
+    'home': (None, 200, _home, True),
+    'home_search': (None, 200, _home_search, True),
+    'dashboard_jobseeker': ('jobseeker', 200, _dashboard, False),
+    'dashboard_employer': ('employer', 200, _dashboard, False),
+    'dashboard_admin': ('admin', 200, _dashboard, False),
+    'apply_hot': ('jobseeker', 302, _apply_hot, False),
+    'apply_db': ('jobseeker', 302, _apply_db, False),
+    'login': (None, 302, _login, False),
+    'post_job': ('employer', 302, _post_job, False),
+}
+# Scenarios whose request is made with an account of this role, without logging in first
+ACCOUNT_ROLES = {'login': 'jobseeker'}
+
+
+def load_fixtures(db_path):
+    """Usernames per role and id ranges the request builders pick from."""
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        accounts = {
+            role: [row[0] for row in conn.execute(
+                'SELECT username FROM user WHERE role = ? ORDER BY id LIMIT ?', (role, ACCOUNTS_PER_ROLE))]
+            for role in ('admin', 'employer', 'jobseeker')
+        }
+        max_job_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM job').fetchone()[0]
+        size = {table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                for table in ('user', 'job', 'application')}
+    finally:
+        conn.close()
+    return {'accounts': accounts, 'max_job_id': max_job_id, 'hot_job_ids': [job['id'] for job in HOT_JOBS],
+            'size': size}
+
+
+def _worker_plan(scenario, fixtures, worker, seed):
+    role, expected, builder, _ = SCENARIOS[scenario]
+    rng = random.Random(f'{seed}:{scenario}:{worker}')
+    account_role = role or ACCOUNT_ROLES.get(scenario)
+    account = None
+    if account_role:
+        accounts = fixtures['accounts'][account_role]
+        if not accounts:
+            raise SystemExit(f'Scenario {scenario} needs a {account_role} account in the database')
+        account = accounts[worker % len(accounts)]
+    return role, expected, builder, rng, account
+
+
+def _record(results, status, expected, elapsed):
+    if status == expected:
+        results['latencies'].append(elapsed)
+    else:
+        results['errors'] += 1
+    results['statuses'][str(status)] = results['statuses'].get(str(status), 0) + 1
+
+
+def _new_results():
+    return {'latencies': [], 'errors': 0, 'statuses': {}, 'start': None, 'end': None}
+
+
+def _merge(parts):
+    merged = _new_results()
+    for part in parts:
+        merged['latencies'].extend(part['latencies'])
+        merged['errors'] += part['errors']
+        for status, count in part['statuses'].items():
+            merged['statuses'][status] = merged['statuses'].get(status, 0) + count
+    merged['start'] = min(part['start'] for part in parts)
+    merged['end'] = max(part['end'] for part in parts)
+    return merged
+
+
+def _summarize(merged, scenario, cache_enabled):
+    # Throughput over the span in which any client was sending timed requests
+    summary = latency_summary(merged['latencies'], elapsed=merged['end'] - merged['start'])
+    summary['errors'] = merged['errors']
+    summary['statuses'] = dict(sorted(merged['statuses'].items()))
+    summary['listing_cache'] = cache_enabled and SCENARIOS[scenario][3]  # Mostly cache hits, not page work
+    return summary
+
+
+def _split(total, parts):
+    return [total // parts + (1 if index < total % parts else 0) for index in range(parts)]
+
+
+# ===================
+# Test client mode
+# ===================
+
+def run_client_scenario(app, scenario, fixtures, requests, concurrency, seed, cache_enabled):
+    parts = [_new_results() for _ in range(concurrency)]
+
+    def work(worker, count):
+        role, expected, builder, rng, account = _worker_plan(scenario, fixtures, worker, seed)
+        client = app.test_client()
+        if role:
+            client.post('/login', data={'username': account, 'password': BENCH_PASSWORD})
+        results = parts[worker]
+        results['start'] = time.perf_counter()
+        for _ in range(count):
+            method, path, data = builder(rng, fixtures, account)
+            started = time.perf_counter()
+            response = client.open(path, method=method, data=data)
+            _record(results, response.status_code, expected, time.perf_counter() - started)
+        results['end'] = time.perf_counter()
+
+    threads = [threading.Thread(target=work, args=(worker, count))
+               for worker, count in enumerate(_split(requests, concurrency))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return _summarize(_merge(parts), scenario, cache_enabled)
+
+
+def run_client_mode(db_path, scenarios, fixtures, args):
+    from app import create_app, password_hasher
+    config = {'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}'}
+    if args.no_cache:
+        config['CACHE_BACKEND'] = 'null'
+    app = create_app(config)
+    results = {}
+    try:
+        for scenario in scenarios:
+            results[scenario] = run_client_scenario(app, scenario, fixtures, args.requests, args.concurrency,
+                                                    args.seed, not args.no_cache)
+            results[scenario]['peak_rss_kb'] = peak_rss_kb()  # Whole process, so far
+    finally:
+        password_hasher.shutdown()
+    return results, {'process_kb': peak_rss_kb()}
+
+
+# ===================
+# HTTP mode
+# ===================
+
+class HttpClient:
+    """Minimal HTTP client that keeps the session cookie and does not follow redirects."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.cookie = None
+
+    def request(self, method, path, data=None):
+        body = urlencode(data).encode() if data is not None else None
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'} if body is not None else {}
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        # New connection per request, like a browser behind a proxy that does not keep alive to sync workers
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            cookie = response.getheader('Set-Cookie')
+            if cookie:
+                self.cookie = cookie.split(';', 1)[0]
+            return response.status
+        finally:
+            conn.close()
+
+
+def http_worker(task):
+    scenario, fixtures, worker, count, port, seed = task
+    role, expected, builder, rng, account = _worker_plan(scenario, fixtures, worker, seed)
+    client = HttpClient('127.0.0.1', port)
+    if role:
+        client.request('POST', '/login', {'username': account, 'password': BENCH_PASSWORD})
+    results = _new_results()
+    results['start'] = time.time()  # Wall clock: compared across processes
+    for _ in range(count):
+        method, path, data = builder(rng, fixtures, account)
+        started = time.perf_counter()
+        try:
+            status = client.request(method, path, data)
+        except OSError:
+            status = 'connection-error'
+        _record(results, status, expected, time.perf_counter() - started)
+    results['end'] = time.time()
+    return results
+
+
+def _children(pid):
+    children = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat:
+                # The ppid is the second field after the parenthesized command name
+                if int(stat.read().rsplit(')', 1)[1].split()[1]) == pid:
+                    children.append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    return children
+
+
+def _server_rss(master_pid):
+    workers = [rss for rss in (peak_rss_kb(pid) for pid in _children(master_pid)) if rss is not None]
+    return {'master_kb': peak_rss_kb(master_pid), 'max_worker_kb': max(workers, default=None),
+            'total_workers_kb': sum(workers)}
+
+
+def _wait_until_serving(server, port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f'gunicorn exited with status {server.returncode}')
+        try:
+            HttpClient('127.0.0.1', port).request('GET', '/api/hot-jobs')
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit('gunicorn did not start in time')
+
+
+def run_http_mode(db_path, scenarios, fixtures, args):
+    env = dict(os.environ, FLASK_SQLALCHEMY_DATABASE_URI=f'sqlite:///{db_path}')
+    if args.no_cache:
+        env['FLASK_CACHE_BACKEND'] = 'null'
+    else:
+        # Shared by the workers, so a post in one invalidates them all
+        env['FLASK_CACHE_BACKEND'] = 'sqlite'
+        env['FLASK_CACHE_PATH'] = os.path.join(os.path.dirname(db_path), 'listing_cache.db')
+    command = ['gunicorn', '--workers', str(args.gunicorn_workers), '--bind', f'127.0.0.1:{args.port}',
+               '--log-level', 'warning', *args.gunicorn_arg, 'app:create_app()']
+    server = subprocess.Popen(command, cwd=REPO_ROOT, env=env)
+    results = {}
+    try:
+        _wait_until_serving(server, args.port)
+        with multiprocessing.Pool(args.concurrency) as pool:
+            for scenario in scenarios:
+                tasks = [(scenario, fixtures, worker, count, args.port, args.seed)
+                         for worker, count in enumerate(_split(args.requests, args.concurrency)) if count]
+                results[scenario] = _summarize(_merge(pool.map(http_worker, tasks)), scenario, not args.no_cache)
+                results[scenario]['peak_rss_kb'] = _server_rss(server.pid)  # Server processes, so far
+        rss = _server_rss(server.pid)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+    return results, rss
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('database', help='Database created by bench/seed.py (copied, never modified).')
+    parser.add_argument('--mode', choices=('client', 'http'), default='client')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help=f'Comma-separated subset of: {", ".join(SCENARIOS)}.')
+    parser.add_argument('--requests', type=int, default=200, help='Timed requests per scenario.')
+    parser.add_argument('--concurrency', type=int, default=4, help='Client threads (client) or processes (http).')
+    parser.add_argument('--gunicorn-workers', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--gunicorn-arg', action='append', default=[],
+                        help='Extra gunicorn argument, e.g. --gunicorn-arg=--threads=4 (repeatable).')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--no-cache', action='store_true', help='Run with CACHE_BACKEND=null.')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for request parameters.')
+    parser.add_argument('--output', help='Also write the JSON report to this file.')
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(unknown)}')
+    if not os.path.exists(args.database):
+        parser.error(f'{args.database} does not exist; create it with bench/seed.py')
+
+    scratch = tempfile.mkdtemp(prefix='jobportal-bench-')
+    db_path = os.path.join(scratch, 'bench.db')
+    shutil.copyfile(args.database, db_path)
+    try:
+        fixtures = load_fixtures(db_path)
+        run = run_http_mode if args.mode == 'http' else run_client_mode
+        results, rss = run(db_path, scenarios, fixtures, args)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    report = {
+        'revision': git_revision(),
+        'mode': args.mode,
+        'cpus': os.cpu_count(),
+        'database': {'path': args.database, **fixtures['size']},
+        'settings': {name: getattr(args, name) for name in
+                     ('requests', 'concurrency', 'gunicorn_workers', 'no_cache', 'seed')
+                     if args.mode == 'http' or name != 'gunicorn_workers'},
+        'scenarios': results,
+        'peak_rss_kb': rss,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as out:
+            out.write(text + '\n')
+    print(text)
+    errors = sum(result['errors'] for result in results.values())
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == '__main__':
+    main()
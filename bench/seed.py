@@ -0,0 +1,168 @@
+"""
+Synthetic data generator for benchmarks.
+
+Creates a fresh database with create_app() (so the schema, indexes and search
+table are exactly what the app would create), then bulk-loads users, jobs and
+applications with executemany over a raw sqlite3 connection, with journaling
+off for the load. Output is deterministic for a given ``--seed``, so two
+commits can be measured against the same data.
+
+Every user's password is ``bench-password``. Users are named by role:
+``bench_admin_0``, ``bench_employer_0``, ``bench_jobseeker_0`` and so on.
+
+    python bench/seed.py /tmp/bench.db --users 100000 --jobs 300000 --applications 600000
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hot_jobs import HOT_JOBS  # noqa: E402
+from parsing import parse_experience, parse_salary  # noqa: E402
+
+BENCH_PASSWORD = 'bench-password'
+ROLES = ('admin', 'employer', 'jobseeker')
+
+# Vocabulary borrowed from the demo catalog, so searches and filters behave like real listings
+TITLES = sorted({job['title'] for job in HOT_JOBS})
+COMPANIES = sorted({job['company'] for job in HOT_JOBS})
+LOCATIONS = sorted({job['location'] for job in HOT_JOBS})
+SALARIES = sorted({job['salary'] for job in HOT_JOBS}) + ['₹25k/month', '₹40,000 per month', '1.2 Cr', None]
+EXPERIENCES = sorted({job['experience'] for job in HOT_JOBS}) + ['Fresher', '10+ years', None]
+DESCRIPTION_WORDS = sorted({word.strip('.,').lower() for job in HOT_JOBS for word in job['description'].split()})
+# Terms for ``/?q=``: common title words, locations and description words
+SEARCH_TERMS = ('developer', 'engineer', 'analyst', 'bangalore', 'remote', 'cloud', 'react', 'testing')
+
+
+def user_counts(users, employers=None, admins=1):
+    """How many users of each role: ``admins`` admins, ``employers`` (default 10%) employers, the rest job seekers."""
+    admins = min(admins, users)
+    employers = min(users // 10 if employers is None else employers, users - admins)
+    return {'admin': admins, 'employer': employers, 'jobseeker': users - admins - employers}
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _user_rows(counts, password):
+    for role in ROLES:
+        for n in range(counts[role]):
+            name = f'bench_{role}_{n}'
+            yield name, f'{name}@example.com', password, role
+
+
+def _job_rows(rng, count, employer_ids, started):
+    salary_ranges = {text: parse_salary(text) or (None, None) for text in SALARIES}
+    experience_ranges = {text: parse_experience(text) or (None, None) for text in EXPERIENCES}
+    for n in range(count):
+        salary = rng.choice(SALARIES)
+        experience = rng.choice(EXPERIENCES)
+        title = rng.choice(TITLES)
+        description = ' '.join(rng.choices(DESCRIPTION_WORDS, k=rng.randint(8, 40)))
+        # Spread updated_at over the past so feed and "newest" pages see realistic ordering
+        updated_at = started - timedelta(seconds=(count - n) * 30)
+        yield (f'{title} #{n}', description, salary, rng.choice(LOCATIONS), rng.choice(COMPANIES), experience,
+               rng.choice(employer_ids), *salary_ranges[salary], *experience_ranges[experience],
+               updated_at.isoformat(sep=' ', timespec='microseconds'))
+
+
+def seed_database(path, users, jobs, applications, employers=None, admins=1, seed=0, batch_size=50_000):
+    """Create ``path`` and fill it with synthetic rows. Returns a summary dict."""
+    from app import create_app, password_hasher, reconcile_applicant_counts
+    from database import db
+    from models import utcnow
+    from search import rebuild_search_index
+    from werkzeug.security import generate_password_hash
+
+    if os.path.exists(path):
+        raise FileExistsError(f'{path} already exists; seed a new file so runs are reproducible')
+    started = time.perf_counter()
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.abspath(path)}', 'CACHE_BACKEND': 'null'})
+    with app.app_context():
+        # One hash shared by every user: the configured method, so logins cost what they would in production
+        password = generate_password_hash(BENCH_PASSWORD, app.config['PASSWORD_HASH_METHOD'])
+        for engine in db.engines.values():
+            engine.dispose()  # journal_mode can only change with no other connections open
+
+    rng = random.Random(seed)
+    counts = user_counts(users, employers, admins)
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        conn.execute('PRAGMA journal_mode=OFF')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.execute('PRAGMA cache_size=-262144')  # 256 MiB
+        conn.execute('BEGIN')
+        for batch in _batches(_user_rows(counts, password), batch_size):
+            conn.executemany('INSERT INTO user (username, email, password, role) VALUES (?, ?, ?, ?)', batch)
+        role_ids = {role: [row[0] for row in conn.execute('SELECT id FROM user WHERE role = ? ORDER BY id', (role,))]
+                    for role in ROLES}
+
+        if jobs and not role_ids['employer']:
+            raise ValueError('Jobs need at least one employer')
+        for batch in _batches(_job_rows(rng, jobs, role_ids['employer'], utcnow()), batch_size):
+            conn.executemany(
+                'INSERT INTO job (title, description, salary, location, company, experience, employer_id,'
+                ' salary_min, salary_max, experience_min, experience_max, updated_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', batch)
+
+        # Random distinct (job, job seeker) pairs; the unique index drops repeats
+        seekers = role_ids['jobseeker']
+        target = min(applications, jobs * len(seekers))
+        inserted = 0
+        while inserted < target:
+            pairs = [(rng.randint(1, jobs), rng.choice(seekers)) for _ in range(min(batch_size, target - inserted))]
+            before = conn.total_changes
+            conn.executemany('INSERT OR IGNORE INTO application (job_id, user_id) VALUES (?, ?)', pairs)
+            inserted += conn.total_changes - before
+        conn.execute('COMMIT')
+    finally:
+        conn.close()
+
+    with app.app_context():
+        reconcile_applicant_counts()
+        rebuild_search_index(db.session)
+        db.session.commit()
+        db.session.execute(db.text('ANALYZE'))
+        db.session.commit()
+    password_hasher.shutdown()
+    return {
+        'database': path,
+        'seed': seed,
+        'users': counts,
+        'jobs': jobs,
+        'applications': inserted,
+        'elapsed_s': round(time.perf_counter() - started, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('path', help='Database file to create (must not exist).')
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--employers', type=int, default=None, help='Defaults to 10%% of --users.')
+    parser.add_argument('--admins', type=int, default=1)
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--applications', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0, help='Random seed; same seed, same data.')
+    parser.add_argument('--batch-size', type=int, default=50_000, help='Rows per executemany.')
+    args = parser.parse_args(argv)
+    print(json.dumps(seed_database(args.path, args.users, args.jobs, args.applications, employers=args.employers,
+                                   admins=args.admins, seed=args.seed, batch_size=args.batch_size), indent=2))
+
+
+if __name__ == '__main__':
+    main()
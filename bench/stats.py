@@ -0,0 +1,51 @@
+"""Shared measurement helpers for the bench scripts: latency percentiles and peak memory."""
+import os
+import resource
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile_ms(sorted_seconds, fraction):
+    """Nearest-rank percentile of sorted latencies (seconds), in milliseconds."""
+    if not sorted_seconds:
+        return None
+    index = min(len(sorted_seconds) - 1, int(fraction * len(sorted_seconds)))
+    return round(sorted_seconds[index] * 1000, 2)
+
+
+def latency_summary(seconds, elapsed=None):
+    """Count, percentiles and (given the wall time) throughput for a list of latencies."""
+    values = sorted(seconds)
+    summary = {
+        'count': len(values),
+        'p50_ms': percentile_ms(values, 0.50),
+        'p95_ms': percentile_ms(values, 0.95),
+        'p99_ms': percentile_ms(values, 0.99),
+    }
+    if elapsed is not None:
+        summary['throughput_rps'] = round(len(values) / elapsed, 1) if elapsed else None
+    return summary
+
+
+def peak_rss_kb(pid=None):
+    """Peak resident set size in KiB of this process, or of ``pid`` (Linux /proc only)."""
+    if pid is None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KiB on Linux
+    try:
+        with open(f'/proc/{pid}/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def git_revision():
+    """Current commit of the repo, so results can be compared across commits."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,216 @@
+"""
+Bulk job import and streaming export.
+
+Imports read CSV or JSONL incrementally, validate each row on its own, and
+insert valid rows in batched transactions (one executemany per batch). A bad
+row is reported with its line number and skipped; it never aborts the file.
+Exports walk tables in id-ordered keyset batches and yield text chunks, so
+neither side ever holds a whole table in memory.
+"""
+import csv
+import io
+import json
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from parsing import parse_experience, parse_salary
+from search import index_jobs
+
+FORMATS = ('csv', 'jsonl')
+
+# Importable job fields -> max length (None = unbounded), mirroring the Job model
+JOB_FIELDS = {
+    'title': 100,
+    'company': 50,
+    'location': 50,
+    'salary': 20,
+    'description': None,
+    'experience': 20,
+}
+REQUIRED_JOB_FIELDS = ('title', 'company', 'location', 'salary', 'description')
+
+EXPORT_JOB_COLUMNS = ('id', 'title', 'company', 'location', 'salary', 'experience', 'description',
+                      'employer_id')
+EXPORT_APPLICATION_COLUMNS = ('id', 'job_id', 'user_id')
+
+
+class ImportReport:
+    """Outcome of an import: how many rows went in and why the others did not."""
+
+    def __init__(self):
+        self.imported = 0
+        self.errors = []  # (line number, message)
+
+    def add_error(self, line_no, message):
+        self.errors.append((line_no, message))
+
+    def to_dict(self):
+        return {
+            'imported': self.imported,
+            'failed': len(self.errors),
+            'errors': [{'line': line_no, 'error': message} for line_no, message in self.errors],
+        }
+
+
+def detect_format(filename, default='csv'):
+    """Guess the import/export format from a file name."""
+    if filename and filename.lower().endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if filename and filename.lower().endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def iter_records(stream, fmt):
+    """
+    Yield (line number, record dict or None, error or None) from a binary stream.
+    Reads one line at a time; malformed lines are yielded as errors.
+    """
+    text_stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    if fmt == 'csv':
+        reader = csv.DictReader(text_stream)
+        try:
+            for record in reader:
+                if None in record:
+                    yield reader.line_num, None, 'Too many values in row'
+                    continue
+                yield reader.line_num, record, None
+        except (csv.Error, UnicodeDecodeError) as exc:
+            yield reader.line_num, None, f'Unreadable CSV: {exc}'
+    elif fmt == 'jsonl':
+        line_no = 0
+        try:
+            for line_no, line in enumerate(text_stream, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as exc:
+                    yield line_no, None, f'Invalid JSON: {exc}'
+                    continue
+                if not isinstance(record, dict):
+                    yield line_no, None, 'Expected a JSON object'
+                    continue
+                yield line_no, record, None
+        except UnicodeDecodeError as exc:
+            yield line_no + 1, None, f'Unreadable text: {exc}'
+    else:
+        raise ValueError(f'Unknown format: {fmt}')
+
+
+def validate_job(record):
+    """Return (clean values, None) for a valid job record, or (None, error message)."""
+    values = {}
+    for field, max_length in JOB_FIELDS.items():
+        value = record.get(field)
+        value = '' if value is None else str(value).strip()
+        if not value:
+            if field in REQUIRED_JOB_FIELDS:
+                return None, f'Missing {field}'
+            value = None
+        elif max_length and len(value) > max_length:
+            return None, f'{field} longer than {max_length} characters'
+        values[field] = value
+    return values, None
+
+
+def job_mapping(values, employer_id):
+    """Row to insert for validated job values, including the parsed numeric ranges."""
+    salary = parse_salary(values['salary']) or (None, None)
+    experience = parse_experience(values['experience']) or (None, None)
+    return dict(
+        values,
+        employer_id=employer_id,
+        salary_min=salary[0], salary_max=salary[1],
+        experience_min=experience[0], experience_max=experience[1],
+    )
+
+
+def import_jobs(session, job_model, records, employer_id, batch_size=500):
+    """
+    Validate and insert job records for ``employer_id`` in batches.
+
+    Each batch is one executemany insert plus one search index update, committed
+    together. If a batch fails in the database, it is retried row by row so only
+    the offending rows are reported. Returns an ImportReport.
+    """
+    report = ImportReport()
+    batch = []
+    for line_no, record, error in records:
+        if error is None:
+            values, error = validate_job(record)
+        if error is not None:
+            report.add_error(line_no, error)
+            continue
+        batch.append((line_no, job_mapping(values, employer_id)))
+        if len(batch) >= batch_size:
+            _insert_job_batch(session, job_model, batch, report)
+            batch = []
+    if batch:
+        _insert_job_batch(session, job_model, batch, report)
+    return report
+
+
+def _insert_job_batch(session, job_model, batch, report):
+    statement = insert(job_model).returning(job_model.id)
+    try:
+        ids = session.execute(statement, [mapping for _, mapping in batch]).scalars().all()
+        index_jobs(session, ids)
+        session.commit()
+        report.imported += len(ids)
+        return
+    except SQLAlchemyError:
+        session.rollback()
+    # Isolate the failing rows
+    for line_no, mapping in batch:
+        try:
+            job_id = session.execute(statement, [mapping]).scalar_one()
+            index_jobs(session, [job_id])
+            session.commit()
+            report.imported += 1
+        except SQLAlchemyError as exc:
+            session.rollback()
+            report.add_error(line_no, str(getattr(exc, 'orig', None) or exc))
+
+
+def iter_table_rows(session, columns, id_column, where=None, batch_size=1000):
+    """Yield row tuples in id order, fetching one keyset batch at a time."""
+    last_id = None
+    while True:
+        query = select(*columns).order_by(id_column).limit(batch_size)
+        if where is not None:
+            query = query.where(where)
+        if last_id is not None:
+            query = query.where(id_column > last_id)
+        rows = session.execute(query).all()
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1][0]
+
+
+def export_rows(rows, column_names, fmt, chunk_rows=500):
+    """Serialize row tuples to CSV or JSONL, yielding text chunks of up to ``chunk_rows`` rows."""
+    if fmt not in FORMATS:
+        raise ValueError(f'Unknown format: {fmt}')
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == 'csv' else None
+    if writer:
+        writer.writerow(column_names)
+    pending = 0
+    for row in rows:
+        if writer:
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(dict(zip(column_names, row)), ensure_ascii=False))
+            buffer.write('\n')
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
@@ -0,0 +1,302 @@
+"""
+Cache for rendered job listing pages and fragments.
+
+Entries are keyed by a normalized query string plus a generation number.
+Writes that change job listings call ``invalidate()``, which bumps the
+generation: every older entry becomes unreachable at once and ages out
+through normal LRU/TTL eviction.
+
+Two backends are provided:
+
+* ``MemoryBackend`` - per-process LRU dict. Fastest, but each gunicorn worker
+  has its own copy and its own generation, so only use it with one worker.
+* ``SQLiteBackend`` - a small SQLite file on local disk shared by every worker
+  on the host, so an invalidation in one worker is seen by all of them. Hits
+  are plain reads; their LRU recency is buffered and written in batches.
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class MemoryBackend:
+    """In-process LRU store bounded by entry count and total bytes, with a TTL per entry."""
+
+    def __init__(self, max_entries=512, max_bytes=32 * 1024 * 1024, ttl=300):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (value, size, expires)
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def generation(self):
+        return self._generation
+
+    def bump_generation(self):
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, size, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size, time.monotonic() + self.ttl)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def info(self):
+        return {'backend': 'memory', 'entries': len(self._entries), 'bytes': self._bytes,
+                'generation': self._generation}
+
+
+class SQLiteBackend:
+    """
+    LRU store in a local SQLite file, shared by all worker processes on the host.
+
+    A hit does not write: the key's access time is buffered in the process and
+    flushed in one batch by the next ``set`` or, at most once per
+    ``touch_interval`` seconds, by a hit. Recency is approximate, which is all
+    eviction needs, and reads never queue behind the cache's write lock.
+    """
+
+    def __init__(self, path, max_entries=4096, max_bytes=256 * 1024 * 1024, ttl=300, touch_interval=5):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self._touched = {}  # key -> last access not yet written
+        self._touched_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def _connect(self):
+        # One connection per thread, reopened after fork so workers never share a handle
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=OFF')  # Losing cache entries on power loss is fine
+        conn.executescript(
+            'CREATE TABLE IF NOT EXISTS cache_entry ('
+            '  key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,'
+            '  expires REAL NOT NULL, last_access REAL NOT NULL);'
+            'CREATE INDEX IF NOT EXISTS ix_cache_entry_last_access ON cache_entry (last_access);'
+            'CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);'
+            "INSERT OR IGNORE INTO cache_meta (name, value) VALUES ('generation', 0);"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def generation(self):
+        row = self._connect().execute("SELECT value FROM cache_meta WHERE name = 'generation'").fetchone()
+        return row[0]
+
+    def bump_generation(self):
+        conn = self._connect()
+        conn.execute("UPDATE cache_meta SET value = value + 1 WHERE name = 'generation'")
+        return self.generation()
+
+    def get(self, key):
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute('SELECT value FROM cache_entry WHERE key = ? AND expires > ?', (key, now)).fetchone()
+        if row is None:
+            return None
+        with self._touched_lock:
+            self._touched[key] = now
+            flush_due = time.monotonic() - self._last_flush >= self.touch_interval
+        if flush_due:
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                self._flush_touched(conn)
+                conn.execute('COMMIT')
+            except sqlite3.OperationalError:
+                # Cache busy: skip this round rather than delay the hit; the times are only hints
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+        return row[0]
+
+    def _flush_touched(self, conn):
+        # Caller holds the write transaction
+        with self._touched_lock:
+            touched, self._touched = self._touched, {}
+            self._last_flush = time.monotonic()
+        if touched:
+            conn.executemany('UPDATE cache_entry SET last_access = ? WHERE key = ?',
+                             [(when, key) for key, when in touched.items()])
+
+    def set(self, key, value):
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._flush_touched(conn)  # Before eviction, so recently hit entries survive it
+            conn.execute(
+                'INSERT OR REPLACE INTO cache_entry (key, value, size, expires, last_access) VALUES (?, ?, ?, ?, ?)',
+                (key, value, size, now + self.ttl, now)
+            )
+            conn.execute('DELETE FROM cache_entry WHERE expires <= ?', (now,))
+            conn.execute(
+                'DELETE FROM cache_entry WHERE key IN ('
+                '  SELECT key FROM cache_entry ORDER BY last_access DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM cache_entry').fetchone()[0]
+            if total > self.max_bytes:
+                for old_key, old_size in conn.execute(
+                        'SELECT key, size FROM cache_entry ORDER BY last_access').fetchall():
+                    conn.execute('DELETE FROM cache_entry WHERE key = ?', (old_key,))
+                    total -= old_size
+                    if total <= self.max_bytes:
+                        break
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def info(self):
+        entries, size = self._connect().execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entry').fetchone()
+        return {'backend': 'sqlite', 'path': self.path, 'entries': entries, 'bytes': size,
+                'generation': self.generation()}
+
+
+class NullBackend:
+    """Backend that stores nothing; disables caching."""
+
+    def generation(self):
+        return 0
+
+    def bump_generation(self):
+        return 0
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+    def info(self):
+        return {'backend': 'null'}
+
+
+class ListingCache:
+    """Generation-invalidated cache of rendered listing HTML, keyed by normalized query args."""
+
+    def __init__(self, backend=None, key_args=()):
+        self.backend = backend or NullBackend()
+        self.key_args = tuple(key_args)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def init_app(self, app):
+        """Use the backend selected by the app's CACHE_* settings."""
+        self.backend = create_backend(app.config)
+
+    def normalize_args(self, args, key_args=None):
+        """
+        The args that affect the listing, as the key sees them: unknown and
+        empty args are dropped and values are trimmed (q is case-folded).
+        ``key_args`` overrides the default arg names. Render cached pages from
+        these, never from the raw request, so the HTML depends only on the key.
+        """
+        normalized = {}
+        for name in key_args or self.key_args:
+            value = (args.get(name) or '').strip()
+            if name == 'q':
+                value = value.lower()
+            if value:
+                normalized[name] = value
+        return normalized
+
+    def make_key(self, namespace, args, key_args=None):
+        """
+        Build a cache key from the normalized args (see ``normalize_args``);
+        order does not matter.
+
+        The key embeds the current generation, so take it once, before reading
+        the database, and use it for both ``get`` and ``set``: a render built
+        from rows read before an invalidation is then stored under the old
+        generation, where nobody will look it up.
+        """
+        parts = [f'{name}={value}' for name, value in self.normalize_args(args, key_args).items()]
+        return f'{namespace}:{self.backend.generation()}:' + '&'.join(parts)
+
+    def get(self, key):
+        """Cached HTML (or other text) for a key from ``make_key``, or None."""
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value.decode('utf-8')
+
+    def set(self, key, html):
+        self.backend.set(key, html.encode('utf-8'))
+
+    def invalidate(self):
+        """Make every cached entry stale. Call after any write that changes listings."""
+        self.invalidations += 1
+        self.backend.bump_generation()
+
+    def stats(self):
+        """Hit/miss counters for this process plus backend size information."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+            'invalidations': self.invalidations,
+            **self.backend.info(),
+        }
+
+
+def create_backend(config):
+    """Build the cache backend selected by the CACHE_* settings in ``config``."""
+    name = config.get('CACHE_BACKEND', 'memory')
+    bounds = {
+        'max_entries': config.get('CACHE_MAX_ENTRIES', 512),
+        'max_bytes': config.get('CACHE_MAX_BYTES', 32 * 1024 * 1024),
+        'ttl': config.get('CACHE_TTL', 300),
+    }
+    if name == 'memory':
+        return MemoryBackend(**bounds)
+    if name == 'sqlite':
+        return SQLiteBackend(config['CACHE_PATH'], touch_interval=config.get('CACHE_TOUCH_INTERVAL', 5), **bounds)
+    if name == 'null':
+        return NullBackend()
+    raise ValueError(f'Unknown CACHE_BACKEND: {name}')
@@ -0,0 +1,81 @@
+"""
+Default configuration.
+
+Every setting below can be overridden from the environment with a ``FLASK_``
+prefix (values are parsed as JSON when possible), for example::
+
+    FLASK_SQLALCHEMY_DATABASE_URI=sqlite:////srv/jobportal/jobportal.db
+    FLASK_DB_READ_POOL=true
+    FLASK_CACHE_BACKEND=sqlite
+    FLASK_PROFILING_ENABLED=true
+
+``create_app(config)`` applies explicit overrides on top of both.
+"""
+
+
+class Config:
+    SECRET_KEY = 'secret_key_for_session'  # Secret key for sessions and security; override in production
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///jobportal.db'  # Relative SQLite paths live in the instance folder
+
+    # --- Database engine ---
+    # Connection pool for the primary (read-write) engine
+    DB_POOL_SIZE = 5
+    DB_MAX_OVERFLOW = 10
+    DB_POOL_TIMEOUT = 30  # Seconds to wait for a free connection
+    # Separate pool for read-only queries (home page, dashboards, exports). DB_READ_URL defaults
+    # to the primary database; with WAL these readers never wait on, or hold up, the writer.
+    # Set to false to run every query through the primary engine.
+    DB_READ_POOL = True
+    DB_READ_URL = None
+    DB_READ_POOL_SIZE = 10
+    DB_READ_MAX_OVERFLOW = 20
+    # SQLite tuning applied to every new connection
+    SQLITE_JOURNAL_MODE = 'WAL'  # Readers and the writer no longer block each other
+    SQLITE_SYNCHRONOUS = 'NORMAL'  # Safe with WAL; fsync at checkpoints instead of every commit
+    SQLITE_BUSY_TIMEOUT_MS = 5000  # Wait this long for the write lock instead of failing with "database is locked"
+
+    # --- Password hashing ---
+    # Werkzeug method string; raising the cost upgrades stored hashes on each user's next login
+    PASSWORD_HASH_METHOD = 'scrypt:32768:8:1'
+    # Hashing processes per web worker; 0 hashes inline on the request thread. The pool and its queue
+    # only help with threaded workers (gunicorn -k gthread); a sync worker never has more than one hash pending
+    PASSWORD_HASH_WORKERS = 2
+    PASSWORD_HASH_QUEUE = 16  # Hashes running or waiting per web worker before login/register answer 503
+    PASSWORD_HASH_TIMEOUT = 10  # Seconds to wait for a queued hash before answering 503
+
+    # --- Job applications ---
+    # Write-behind: queue applications and commit them in batches from one background thread per
+    # worker; each request still waits for its own batch, so answers stay exact
+    APPLY_WRITE_BEHIND = False  # Only batches with threaded workers (gunicorn -k gthread); no gain with sync workers
+    APPLY_FLUSH_INTERVAL_MS = 5  # How long a batch collects applications before committing
+    APPLY_BATCH_SIZE = 200
+    APPLY_QUEUE_SIZE = 10000  # Applications waiting per worker before apply answers 503
+    APPLY_WRITE_TIMEOUT = 10  # Seconds a request waits for its batch to commit before answering 503
+
+    # --- Listings ---
+    JOBS_PER_PAGE = 20  # Page size for home page job listings
+    ADMIN_PER_PAGE = 50  # Page size for admin dashboard listings
+
+    # --- Listing cache: 'memory' (per process), 'sqlite' (shared by all workers on the host) or 'null' ---
+    # With more than one gunicorn worker use 'sqlite': a 'memory' invalidation only reaches the worker that wrote
+    CACHE_BACKEND = 'memory'
+    CACHE_PATH = None  # Defaults to listing_cache.db in the instance folder
+    CACHE_MAX_ENTRIES = 512
+    CACHE_MAX_BYTES = 32 * 1024 * 1024
+    CACHE_TTL = 300  # Seconds
+    CACHE_TOUCH_INTERVAL = 5  # Seconds between LRU recency writes per worker (sqlite backend)
+
+    # --- Job feed API (/api/v1/jobs) ---
+    FEED_PAGE_SIZE = 100
+    FEED_MAX_PAGE_SIZE = 1000
+    FEED_MAX_AGE = 60  # Seconds clients and proxies may reuse a feed page without revalidating
+    # updated_since also returns changes stamped this many seconds earlier: a job's time is taken before
+    # its transaction commits, so a slow write can become visible with a time older than a client's last sync
+    FEED_SYNC_OVERLAP = 60
+
+    # --- Bulk import ---
+    IMPORT_BATCH_SIZE = 500  # Rows per transaction for bulk job imports
+
+    # --- Request profiling (SQL/render timings, Server-Timing header, /_metrics); off by default ---
+    PROFILING_ENABLED = False
+    PROFILING_REPEAT_THRESHOLD = 5  # Same statement this many times in one request logs an N+1 warning
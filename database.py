@@ -0,0 +1,141 @@
+"""
+Database setup: the shared SQLAlchemy object, engine/pool configuration and
+SQLite connection tuning for running under several gunicorn workers.
+
+The primary engine serves all writes. When ``DB_READ_POOL`` is enabled, a
+second engine (bind ``read``) with its own pool and ``PRAGMA query_only``
+serves read-only page queries through ``read_session()``.
+"""
+from contextlib import contextmanager
+
+from flask import current_app, g
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows, where gunicorn does not run either
+    fcntl = None
+
+db = SQLAlchemy()
+
+READ_BIND = 'read'
+
+
+def _is_sqlite_file(url):
+    url = make_url(url)
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+
+def _is_sqlite_memory(url):
+    return make_url(url).get_backend_name() == 'sqlite' and not _is_sqlite_file(url)
+
+
+def _pool_options(url, pool_size, max_overflow, timeout):
+    # In-memory SQLite uses a single static connection; pool sizing does not apply
+    if _is_sqlite_memory(url):
+        return {}
+    return {'pool_size': pool_size, 'max_overflow': max_overflow, 'pool_timeout': timeout}
+
+
+def _sqlite_pragmas(config, read_only=False):
+    pragmas = [
+        f"PRAGMA busy_timeout = {int(config['SQLITE_BUSY_TIMEOUT_MS'])}",
+        f"PRAGMA synchronous = {config['SQLITE_SYNCHRONOUS']}",
+    ]
+    if read_only:
+        # journal_mode is stored in the database file, so only the writer sets it
+        pragmas.append('PRAGMA query_only = ON')
+    else:
+        pragmas.append(f"PRAGMA journal_mode = {config['SQLITE_JOURNAL_MODE']}")
+    return pragmas
+
+
+def _install_sqlite_pragmas(engine, config, read_only=False):
+    """
+    Apply the PRAGMAs to each new connection.
+
+    Transactions keep pysqlite's default of starting at the first write
+    statement, so reads never hold the write lock and a writer waiting for it
+    is covered by busy_timeout.
+    """
+    pragmas = _sqlite_pragmas(config, read_only)
+
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def init_database(app):
+    """Configure engines and pools from app.config and bind ``db`` to the app."""
+    config = app.config
+    uri = config['SQLALCHEMY_DATABASE_URI']
+    engine_options = config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    for key, value in _pool_options(uri, config['DB_POOL_SIZE'], config['DB_MAX_OVERFLOW'],
+                                    config['DB_POOL_TIMEOUT']).items():
+        engine_options.setdefault(key, value)
+
+    read_url = config['DB_READ_URL'] or uri
+    # A second in-memory engine would be a different, empty database
+    if config['DB_READ_POOL'] and not _is_sqlite_memory(read_url):
+        binds = config.setdefault('SQLALCHEMY_BINDS', {})
+        binds[READ_BIND] = {
+            'url': read_url,
+            **_pool_options(read_url, config['DB_READ_POOL_SIZE'], config['DB_READ_MAX_OVERFLOW'],
+                            config['DB_POOL_TIMEOUT']),
+        }
+
+    db.init_app(app)
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            if engine.dialect.name == 'sqlite':
+                _install_sqlite_pragmas(engine, config, read_only=bind_key == READ_BIND)
+
+    app.teardown_appcontext(_close_read_session)
+
+
+def read_session():
+    """
+    Session for read-only queries in the current app context.
+
+    Uses the read pool when it is configured, otherwise the normal
+    ``db.session``. Never write through it.
+    """
+    if READ_BIND not in current_app.config.get('SQLALCHEMY_BINDS', {}):
+        return db.session
+    session = g.get('_read_session')
+    if session is None:
+        session = g._read_session = Session(bind=db.engines[READ_BIND])
+    return session
+
+
+def _close_read_session(exc):
+    session = g.pop('_read_session', None)
+    if session is not None:
+        session.close()
+
+
+@contextmanager
+def schema_lock():
+    """
+    Hold an exclusive lock next to the SQLite file while the schema is created
+    or upgraded, so gunicorn workers booting together run startup migrations
+    one at a time; each one inspects the schema only after taking the lock.
+    A no-op for in-memory databases and where ``fcntl`` is unavailable.
+    Needs an app context.
+    """
+    url = db.engine.url  # Relative paths already resolved to the instance folder
+    if fcntl is None or not _is_sqlite_file(url):
+        yield
+        return
+    with open(f'{url.database}.init-lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,81 @@
+"""
+Read-only job feed for partner aggregators (``/api/v1/jobs``).
+
+Jobs are listed in (updated_at, id) order, so a client can walk the whole
+table with ``after`` cursors and later fetch only what changed with
+``updated_since``. An ``updated_since`` sync also lists deleted jobs, as
+``{"id": ..., "deleted": true, "updated_at": <deletion time>}`` records
+in the same order, and repeats the last ``FEED_SYNC_OVERLAP`` seconds before
+``updated_since`` so a late-committing write is not skipped; clients apply
+records idempotently by id. The serialized page is cached until the next job
+write and served with a strong ETag, so an unchanged repeat poll is a cache
+lookup and a 304 with no body.
+"""
+import heapq
+import json
+from datetime import datetime, timezone
+from itertools import islice
+
+from models import DeletedJob
+from pagination import Page, encode_cursor
+
+FEED_VERSION = 1
+FEED_FORMATS = {'json': 'application/json', 'ndjson': 'application/x-ndjson'}
+FEED_FIELDS = ('id', 'title', 'company', 'location', 'salary', 'experience', 'description',
+               'salary_min', 'salary_max', 'experience_min', 'experience_max', 'updated_at')
+# Query args that select a feed page (used for the cache key)
+FEED_ARGS = ('format', 'updated_since', 'after', 'limit')
+
+
+def parse_timestamp(text):
+    """Parse an ISO 8601 timestamp into naive UTC. Returns None if it is not one."""
+    try:
+        value = datetime.fromisoformat(text.strip().replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def format_timestamp(value):
+    return value.isoformat(timespec='microseconds') + 'Z' if value else None
+
+
+def job_record(job):
+    """Feed representation of one job."""
+    record = {field: getattr(job, field) for field in FEED_FIELDS}
+    record['updated_at'] = format_timestamp(job.updated_at)
+    return record
+
+
+def tombstone_record(tombstone):
+    """Feed representation of a deleted job."""
+    return {'id': tombstone.id, 'deleted': True, 'updated_at': format_timestamp(tombstone.deleted_at)}
+
+
+def _change_key(item):
+    return (item.deleted_at if isinstance(item, DeletedJob) else item.updated_at, item.id)
+
+
+def merge_changes(jobs, deletions, limit):
+    """
+    Merge a page of jobs and a page of tombstones, both read after the same
+    cursor, into one page of at most ``limit`` changes in (time, id) order.
+    """
+    items = list(islice(heapq.merge(jobs.items, deletions.items, key=_change_key), limit))
+    more = jobs.next_cursor or deletions.next_cursor or len(jobs) + len(deletions) > limit
+    return Page(items, next_cursor=encode_cursor(_change_key(items[-1])) if items and more else None)
+
+
+def render_feed(items, fmt, next_cursor=None):
+    """
+    Serialize a page of jobs (and tombstones). JSON wraps them with the version
+    and next cursor; NDJSON is one record per line (the cursor travels in the
+    Link header).
+    """
+    records = [tombstone_record(item) if isinstance(item, DeletedJob) else job_record(item) for item in items]
+    if fmt == 'ndjson':
+        return ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+    return json.dumps({'version': FEED_VERSION, 'jobs': records, 'next_cursor': next_cursor},
+                      ensure_ascii=False, separators=(',', ':'))
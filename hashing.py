@@ -0,0 +1,132 @@
+"""
+Password hashing in a bounded process pool.
+
+Werkzeug's KDFs (scrypt, pbkdf2) are deliberately slow: tens to hundreds of
+milliseconds of CPU per call. Running them in a small process pool keeps that
+CPU off the web worker, caps how many hashes one worker runs at once, and
+sheds load when too many logins pile up: once ``PASSWORD_HASH_QUEUE`` calls
+are pending, further ones raise ``HashingBusy`` instead of queueing without
+bound (the app turns that into a 503 with ``Retry-After``).
+
+The pool and its backpressure only matter with threaded web workers
+(``gunicorn -k gthread --threads N``). A sync worker handles one request at
+a time, so it never has more than one hash pending: the queue never fills,
+and the pool only adds a round trip to another process.
+
+A slot is held until the hash actually finishes (or is cancelled), not just
+until the caller stops waiting, so timed-out calls still count against the
+queue. Pool processes are started from a fork server rather than forked from
+the (possibly multi-threaded) web worker.
+
+Cost is tuned with ``PASSWORD_HASH_METHOD``. Stored hashes made with other
+parameters are detected by ``needs_rehash`` and upgraded on a successful
+login when the pool has an idle process (otherwise on a later one), so
+changing the cost never forces password resets.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeout
+from functools import cached_property
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+def _pool_context():
+    # forkserver children are forked from a clean single-threaded server, never from a threaded web worker
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return None
+
+
+class HashingBusy(Exception):
+    """Raised when the hashing queue is full; the caller should retry later."""
+
+
+class PasswordHasher:
+    """Flask extension that hashes and verifies passwords off the request thread."""
+
+    def __init__(self, app=None):
+        self.method = 'scrypt:32768:8:1'
+        self.workers = 0
+        self.max_pending = 0
+        self.timeout = None
+        self._slots = None
+        self._pending = 0  # Hashes submitted and not yet finished
+        self._pending_lock = threading.Lock()
+        self._executor = None
+        self._executor_pid = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.method = app.config['PASSWORD_HASH_METHOD']
+        self.workers = app.config['PASSWORD_HASH_WORKERS']
+        self.max_pending = max(app.config['PASSWORD_HASH_QUEUE'], self.workers)
+        self.timeout = app.config['PASSWORD_HASH_TIMEOUT']
+        self._slots = threading.BoundedSemaphore(self.max_pending) if self.workers else None
+        self.__dict__.pop('method_prefix', None)
+
+    def _get_executor(self):
+        # Created lazily in each web worker process, so the pool is never shared across a fork
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_pool_context())
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def _release(self):
+        with self._pending_lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def _run(self, fn, *args, idle_only=False):
+        if not self.workers:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            raise HashingBusy()
+        with self._pending_lock:
+            if idle_only and self._pending >= self.workers:
+                self._slots.release()
+                raise HashingBusy()
+            self._pending += 1
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        # Free the slot when the work is done, not when this caller gives up waiting
+        future.add_done_callback(lambda _: self._release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FuturesTimeout:
+            future.cancel()  # Drops it if it has not started yet
+            raise HashingBusy() from None
+
+    def hash(self, password, idle_only=False):
+        """
+        Hash a password with the configured method. With ``idle_only``, raise
+        ``HashingBusy`` unless a pool process is free right now, for optional
+        work that should never queue behind logins.
+        """
+        return self._run(generate_password_hash, password, self.method, idle_only=idle_only)
+
+    def verify(self, stored_hash, password):
+        """True if the password matches the stored hash."""
+        return self._run(check_password_hash, stored_hash, password)
+
+    @cached_property
+    def method_prefix(self):
+        # Fully expanded method (e.g. "pbkdf2" -> "pbkdf2:sha256:600000"), as stored before the salt
+        return generate_password_hash('', self.method).split('$', 1)[0]
+
+    def needs_rehash(self, stored_hash):
+        """True if the stored hash was made with a different method or cost than configured."""
+        return stored_hash.split('$', 1)[0] != self.method_prefix
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None and self._executor_pid == os.getpid():
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,156 @@
+"""
+Catalog of demo "hot jobs".
+
+This module is the single source of truth for hot jobs: the apply route looks
+them up here and the home page fetches them from ``/api/hot-jobs`` instead of
+carrying its own copy. The catalog keeps an id index and per-facet indexes so
+lookups and filtering never scan the whole list.
+"""
+import json
+
+from parsing import parse_experience
+from responses import StaticPayload
+
+# Static list of demo "hot jobs" for display and applications simulation
+HOT_JOBS = [
+    {"id": 1, "title": "Frontend Developer", "description": "Work with React.js and build responsive UIs.", "type": "Full Time", "category": "Development", "location": "Bangalore", "salary": "₹8-10 LPA", "company": "TechNova", "experience": "2-4 years"},
+    {"id": 2, "title": "Backend Developer", "description": "Develop APIs using Node.js and Express.", "type": "Full Time", "category": "Development", "location": "Hyderabad", "salary": "₹10-12 LPA", "company": "CodeBase", "experience": "2-4 years"},
+    {"id": 3, "title": "UI/UX Designer", "description": "Design modern and intuitive user interfaces.", "type": "Full Time", "category": "Design", "location": "Mumbai", "salary": "₹6-8 LPA", "company": "DesignHub", "experience": "3-5 years"},
+    {"id": 4, "title": "DevOps Engineer", "description": "Manage CI/CD pipelines and cloud infra.", "type": "Full Time", "category": "DevOps", "location": "Remote", "salary": "₹9-12 LPA", "company": "CloudOps", "experience": "3-6 years"},
+    {"id": 5, "title": "Data Analyst", "description": "Analyze data and provide business insights.", "type": "Full Time", "category": "Data", "location": "Pune", "salary": "₹7-9 LPA", "company": "DataWorks", "experience": "1-3 years"},
+    {"id": 6, "title": "Machine Learning Engineer", "description": "Build ML models and deploy in production.", "type": "Full Time", "category": "AI/ML", "location": "Bangalore", "salary": "₹12-15 LPA", "company": "AI Labs", "experience": "5+ years"},
+    {"id": 7, "title": "Product Manager", "description": "Lead cross-functional teams to build products.", "type": "Full Time", "category": "Product", "location": "Gurgaon", "salary": "₹15-18 LPA", "company": "Prodify", "experience": "6+ years"},
+    {"id": 8, "title": "QA Tester", "description": "Perform manual and automation testing.", "type": "Full Time", "category": "Testing", "location": "Chennai", "salary": "₹5-7 LPA", "company": "BugSquashers", "experience": "0-2 years"},
+    {"id": 9, "title": "Content Writer", "description": "Write blogs, website content, and case studies.", "type": "Full Time", "category": "Content", "location": "Remote", "salary": "₹4-5 LPA", "company": "WriteWave", "experience": "1-3 years"},
+    {"id": 10, "title": "HR Executive", "description": "Handle recruitment and employee engagement.", "type": "Full Time", "category": "HR", "location": "Noida", "salary": "₹4-6 LPA", "company": "PeopleFirst", "experience": "1-3 years"},
+    {"id": 11, "title": "Digital Marketing Executive", "description": "Run paid campaigns and manage SEO.", "type": "Full Time", "category": "Marketing", "location": "Delhi", "salary": "₹5-7 LPA", "company": "GrowthHacks", "experience": "1-3 years"},
+    {"id": 12, "title": "Cloud Architect", "description": "Design and implement cloud solutions.", "type": "Full Time", "category": "Cloud", "location": "Bangalore", "salary": "₹18-22 LPA", "company": "SkyNet", "experience": "6+ years"},
+    {"id": 13, "title": "Sales Manager", "description": "Drive sales strategies and lead teams.", "type": "Full Time", "category": "Sales", "location": "Mumbai", "salary": "₹10-14 LPA", "company": "SellWell", "experience": "4-7 years"},
+    {"id": 14, "title": "Business Analyst", "description": "Analyze business processes and suggest solutions.", "type": "Full Time", "category": "Business", "location": "Chandigarh", "salary": "₹8-10 LPA", "company": "BizConsult", "experience": "3-5 years"},
+    {"id": 15, "title": "Customer Support Executive", "description": "Support customers via chat, mail, and calls.", "type": "Full Time", "category": "Support", "location": "Pune", "salary": "₹3.5-5 LPA", "company": "HelpDeskPro", "experience": "0-1 years"},
+    {"id": 16, "title": "IT Support Engineer", "description": "Provide hardware and software support.", "type": "Full Time", "category": "IT", "location": "Ahmedabad", "salary": "₹4-6 LPA", "company": "SysCare", "experience": "1-3 years"},
+    {"id": 17, "title": "Graphic Designer", "description": "Create visuals for digital platforms.", "type": "Full Time", "category": "Design", "location": "Kolkata", "salary": "₹4-6 LPA", "company": "CreativeCore", "experience": "1-3 years"},
+    {"id": 18, "title": "Android Developer", "description": "Build apps with Kotlin and Java.", "type": "Full Time", "category": "Mobile", "location": "Hyderabad", "salary": "₹6-8 LPA", "company": "AppStorm", "experience": "2-4 years"},
+    {"id": 19, "title": "iOS Developer", "description": "Develop iOS apps with Swift.", "type": "Full Time", "category": "Mobile", "location": "Chennai", "salary": "₹7-9 LPA", "company": "SwiftTech", "experience": "2-4 years"},
+    {"id": 20, "title": "Video Editor", "description": "Edit and produce marketing videos.", "type": "Full Time", "category": "Media", "location": "Mumbai", "salary": "₹3.5-5 LPA", "company": "VidEditz", "experience": "1-3 years"},
+    {"id": 21, "title": "SEO Specialist", "description": "Optimize site rankings and content.", "type": "Full Time", "category": "Marketing", "location": "Delhi", "salary": "₹4-6 LPA", "company": "RankHigh", "experience": "2-4 years"},
+    {"id": 22, "title": "Social Media Manager", "description": "Manage content and grow online presence.", "type": "Full Time", "category": "Marketing", "location": "Remote", "salary": "₹5-7 LPA", "company": "Socioly", "experience": "2-5 years"},
+    {"id": 23, "title": "Technical Writer", "description": "Write product guides and documentation.", "type": "Full Time", "category": "Content", "location": "Bangalore", "salary": "₹6-8 LPA", "company": "DocuTech", "experience": "3-5 years"},
+    {"id": 24, "title": "Cybersecurity Analyst", "description": "Protect systems from cyber threats.", "type": "Full Time", "category": "Security", "location": "Gurgaon", "salary": "₹10-13 LPA", "company": "SecureNet", "experience": "4-7 years"},
+    {"id": 25, "title": "AI Researcher", "description": "Work on NLP and computer vision models.", "type": "Full Time", "category": "AI/ML", "location": "Pune", "salary": "₹15-20 LPA", "company": "AIThinkTank", "experience": "6+ years"},
+    {"id": 26, "title": "Project Coordinator", "description": "Coordinate tasks and maintain timelines.", "type": "Full Time", "category": "Management", "location": "Chennai", "salary": "₹5-7 LPA", "company": "PlanIt", "experience": "2-4 years"},
+    {"id": 27, "title": "Technical Support Engineer", "description": "Resolve client issues and provide tech support.", "type": "Full Time", "category": "Support", "location": "Bangalore", "salary": "₹4-6 LPA", "company": "TechHelp", "experience": "1-3 years"},
+    {"id": 28, "title": "Recruiter", "description": "Source and screen potential candidates.", "type": "Full Time", "category": "HR", "location": "Jaipur", "salary": "₹4.5-6 LPA", "company": "HireRight", "experience": "2-4 years"},
+    {"id": 29, "title": "Legal Associate", "description": "Draft contracts and handle legal work.", "type": "Full Time", "category": "Legal", "location": "Delhi", "salary": "₹6-8 LPA", "company": "LawVerse", "experience": "3-5 years"},
+    {"id": 30, "title": "Operations Manager", "description": "Handle daily ops and process improvement.", "type": "Full Time", "category": "Operations", "location": "Kolkata", "salary": "₹9-11 LPA", "company": "Opsify", "experience": "5+ years"},
+    {"id": 31, "title": "Game Developer", "description": "Develop engaging 2D/3D games.", "type": "Full Time", "category": "Gaming", "location": "Pune", "salary": "₹10-14 LPA", "company": "PlayZone", "experience": "3-5 years"},
+    {"id": 32, "title": "Graphic Designer", "description": "Create marketing visuals and assets.", "type": "Part Time", "category": "Design", "location": "Delhi", "salary": "₹4-6 LPA", "company": "DesignMinds", "experience": "0-1 years"},
+    {"id": 33, "title": "Security Analyst", "description": "Monitor and prevent cyber threats.", "type": "Full Time", "category": "Security", "location": "Mumbai", "salary": "₹9-11 LPA", "company": "CyberSafe", "experience": "4-7 years"},
+    {"id": 34, "title": "Product Manager", "description": "Lead product development lifecycle.", "type": "Full Time", "category": "Management", "location": "Remote", "salary": "₹20-25 LPA", "company": "InnovateX", "experience": "6+ years"},
+    {"id": 35, "title": "iOS Developer", "description": "Develop native iOS apps.", "type": "Full Time", "category": "Mobile", "location": "Chennai", "salary": "₹10-13 LPA", "company": "SwiftMob", "experience": "2-5 years"},
+    {"id": 36, "title": "Android Developer", "description": "Create Android mobile applications.", "type": "Full Time", "category": "Mobile", "location": "Noida", "salary": "₹9-12 LPA", "company": "DroidBuild", "experience": "2-5 years"},
+    {"id": 37, "title": "Digital Marketing Intern", "description": "Support online campaigns and content creation.", "type": "Internship", "category": "Marketing", "location": "Gurgaon", "salary": "₹10k/month", "company": "ClickBuzz", "experience": "Fresher"},
+    {"id": 38, "title": "SEO Specialist", "description": "Improve website rankings and traffic.", "type": "Full Time", "category": "Marketing", "location": "Jaipur", "salary": "₹5-7 LPA", "company": "RankFirst", "experience": "2-4 years"},
+    {"id": 39, "title": "Video Editor", "description": "Edit and produce video content.", "type": "Contract", "category": "Media", "location": "Mumbai", "salary": "₹6-8 LPA", "company": "FrameCut", "experience": "1-3 years"},
+    {"id": 40, "title": "UI Designer", "description": "Design user interfaces for web and mobile.", "type": "Full Time", "category": "Design", "location": "Bangalore", "salary": "₹10-12 LPA", "company": "PixelEdge", "experience": "3-5 years"},
+    {"id": 41, "title": "Customer Support Executive", "description": "Handle customer inquiries and support.", "type": "Full Time", "category": "Support", "location": "Ahmedabad", "salary": "₹3.5-5 LPA", "company": "HelpDeskPro", "experience": "0-2 years"},
+    {"id": 42, "title": "Finance Analyst", "description": "Analyze financial performance and reports.", "type": "Full Time", "category": "Finance", "location": "Kolkata", "salary": "₹8-10 LPA", "company": "FinSharp", "experience": "2-4 years"},
+    {"id": 43, "title": "Legal Associate", "description": "Assist in drafting and reviewing legal documents.", "type": "Full Time", "category": "Legal", "location": "Delhi", "salary": "₹7-9 LPA", "company": "LawBridge", "experience": "2-4 years"},
+    {"id": 44, "title": "Business Analyst", "description": "Bridge business needs and tech solutions.", "type": "Full Time", "category": "Analysis", "location": "Hyderabad", "salary": "₹9-11 LPA", "company": "BizIntel", "experience": "3-5 years"},
+    {"id": 45, "title": "Systems Engineer", "description": "Maintain and improve IT infrastructure.", "type": "Full Time", "category": "Infrastructure", "location": "Chandigarh", "salary": "₹6-8 LPA", "company": "InfraTech", "experience": "3-6 years"},
+    {"id": 46, "title": "Robotics Engineer", "description": "Develop robotic automation systems.", "type": "Full Time", "category": "Engineering", "location": "Pune", "salary": "₹14-18 LPA", "company": "RoboCore", "experience": "5+ years"},
+    {"id": 47, "title": "IT Support Specialist", "description": "Troubleshoot and resolve IT issues.", "type": "Full Time", "category": "Support", "location": "Nagpur", "salary": "₹4.5-6 LPA", "company": "FixTech", "experience": "1-3 years"},
+    {"id": 48, "title": "Intern - HR & Admin", "description": "Support HR ops and documentation.", "type": "Internship", "category": "HR", "location": "Jaipur", "salary": "₹1.8-2.2 LPA", "company": "TeamCore", "experience": "Fresher"},
+    {"id": 49, "title": "UX Researcher", "description": "Conduct user studies and usability tests.", "type": "Full Time", "category": "Design", "location": "Remote", "salary": "₹9-12 LPA", "company": "UserLab", "experience": "2-4 years"},
+    {"id": 50, "title": "Salesforce Developer", "description": "Develop custom Salesforce solutions.", "type": "Full Time", "category": "CRM", "location": "Mumbai", "salary": "₹13-16 LPA", "company": "CRMWorld", "experience": "5+ years"}
+]
+
+# Experience filter buckets offered on the home page: (min years, max years or None for open-ended)
+EXPERIENCE_BUCKETS = {
+    'fresher': (0, 0),
+    '1-3': (1, 3),
+    '3-5': (3, 5),
+    '5plus': (5, None),
+}
+
+FACETS = ('category', 'location', 'type', 'experience')
+
+
+def experience_buckets(text):
+    """Names of the experience buckets whose range overlaps the given experience text."""
+    parsed = parse_experience(text)
+    if parsed is None:
+        return []
+    low, high = parsed
+    buckets = []
+    for name, (bucket_low, bucket_high) in EXPERIENCE_BUCKETS.items():
+        if (bucket_high is None or low <= bucket_high) and (high is None or high >= bucket_low):
+            buckets.append(name)
+    return buckets
+
+
+class HotJobCatalog:
+    """Hot jobs indexed by id and by facet value."""
+
+    def __init__(self, jobs):
+        self.jobs = sorted(jobs, key=lambda job: job['id'])
+        self.by_id = {job['id']: job for job in self.jobs}
+        # facet -> value -> list of job ids (in id order)
+        self.facets = {facet: {} for facet in FACETS}
+        for job in self.jobs:
+            for facet in FACETS:
+                values = experience_buckets(job.get('experience')) if facet == 'experience' else [job.get(facet)]
+                for value in values:
+                    if value is not None:
+                        self.facets[facet].setdefault(value, []).append(job['id'])
+        self._facet_sets = {
+            facet: {value: frozenset(ids) for value, ids in index.items()}
+            for facet, index in self.facets.items()
+        }
+        self._payload = None
+
+    def get(self, job_id):
+        """Return the hot job with this id, or None."""
+        return self.by_id.get(job_id)
+
+    def facet_values(self, facet):
+        """Sorted distinct values for a facet."""
+        return sorted(self.facets[facet])
+
+    def filter(self, **criteria):
+        """
+        Jobs matching every given facet value, in id order.
+
+        Walks the shortest matching id list and probes the other facets' sets,
+        so the cost is proportional to the smallest facet, not the catalog.
+        """
+        criteria = {facet: value for facet, value in criteria.items() if value}
+        if not criteria:
+            return list(self.jobs)
+        id_lists = []
+        for facet, value in criteria.items():
+            if facet not in self.facets:
+                raise ValueError(f'Unknown facet: {facet}')
+            id_lists.append((self.facets[facet].get(value, []), facet))
+        id_lists.sort(key=lambda item: len(item[0]))
+        shortest = id_lists[0][0]
+        others = [self._facet_sets[facet].get(criteria[facet], frozenset()) for _, facet in id_lists[1:]]
+        return [self.by_id[job_id] for job_id in shortest if all(job_id in ids for ids in others)]
+
+    def as_dict(self, jobs=None):
+        """JSON-ready representation with facet indexes for client-side filtering."""
+        return {
+            'jobs': self.jobs if jobs is None else jobs,
+            'facets': self.facets,
+        }
+
+    @property
+    def payload(self):
+        """Serialized, hashed and compressed full catalog, built once."""
+        if self._payload is None:
+            body = json.dumps(self.as_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            self._payload = StaticPayload(body)
+        return self._payload
+
+
+catalog = HotJobCatalog(HOT_JOBS)
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+from database import db
+
+
+def utcnow():
+    """Naive UTC timestamp, as stored in DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# ===================
+# Database Models
+# ===================
+
+class User(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(80), unique=True, nullable=False)  # Unique username
+    email = db.Column(db.String(120), unique=True, nullable=False)    # Unique email
+    password = db.Column(db.String(200), nullable=False)  # Hashed password
+    role = db.Column(db.String(20), nullable=False)  # Role of user: jobseeker, employer, or admin
+
+
+class Job(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(100))
+    description = db.Column(db.Text)
+    salary = db.Column(db.String(20))
+    location = db.Column(db.String(50))
+    company = db.Column(db.String(50))
+    experience = db.Column(db.String(20))  # Free text, e.g. "2-4 years" or "Fresher"
+    employer_id = db.Column(db.Integer, db.ForeignKey('user.id'))  # Relation to employer (User)
+    # Numeric ranges parsed from salary/experience text (see set_job_ranges), indexed for range queries
+    salary_min = db.Column(db.Integer, index=True)  # Annual, in rupees
+    salary_max = db.Column(db.Integer, index=True)
+    experience_min = db.Column(db.Integer, index=True)  # Years
+    experience_max = db.Column(db.Integer, index=True)  # None when open-ended ("5+ years")
+    # Denormalized len(applications), bumped in apply_job; `flask reconcile-applicant-counts` repairs drift
+    applicant_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Last change to the listing itself (set on create and in edit_job; not on new applications),
+    # drives the feed's updated_since sync
+    updated_at = db.Column(db.DateTime, default=utcnow, index=True)
+
+
+class Application(db.Model):
+    # One application per user per job, enforced by the database; also serves job_id lookups
+    __table_args__ = (db.Index('uq_application_job_user', 'job_id', 'user_id', unique=True),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('job.id'))
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    # passive_deletes: delete_job removes applications with one DELETE instead of loading them
+    job = db.relationship('Job', backref=db.backref('applications', passive_deletes=True))  # Relationship to job
+
+
+class DeletedJob(db.Model):
+    # Tombstone left by delete_job, so feed clients syncing with updated_since learn the job is gone
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # The deleted job's id
+    deleted_at = db.Column(db.DateTime, nullable=False, default=utcnow, index=True)
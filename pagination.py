@@ -0,0 +1,105 @@
+"""
+Keyset (cursor) pagination.
+
+Instead of OFFSET, each page remembers the sort key of its first and last row
+and the next query seeks past it (``WHERE (key) < (:cursor)``), so every page
+is an index range scan no matter how deep the user goes.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from sqlalchemy import tuple_
+
+
+class Page:
+    """One page of results plus opaque cursors for the neighbouring pages."""
+
+    def __init__(self, items, next_cursor=None, prev_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+
+def _cursor_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()  # Callers sorting on a datetime convert it back with fromisoformat
+    raise TypeError(f'Cannot encode {type(value).__name__} in a cursor')
+
+
+def encode_cursor(values):
+    """Encode a tuple of sort key values as a URL-safe token."""
+    raw = json.dumps(list(values), separators=(',', ':'), default=_cursor_value).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """Decode a cursor token back into a tuple. Returns None for missing or malformed tokens."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        values = json.loads(raw)
+    except (ValueError, binascii.Error):
+        return None
+    if not isinstance(values, list) or not values:
+        return None
+    return tuple(values)
+
+
+def keyset_paginate(query, columns, per_page, after=None, before=None, descending=True):
+    """
+    Fetch one page of ``query`` ordered by ``columns``.
+
+    ``columns`` must form a unique sort key (end with the primary key).
+    ``after``/``before`` are decoded cursors; a cursor that does not match the
+    number of sort columns is ignored and the first page is returned.
+    """
+    columns = tuple(columns)
+    key = tuple_(*columns) if len(columns) > 1 else columns[0]
+    if after is not None and len(after) != len(columns):
+        after = None
+    if before is not None and len(before) != len(columns):
+        before = None
+
+    def bound(values):
+        return tuple_(*values) if len(columns) > 1 else values[0]
+
+    # Walk backwards from `before` by flipping both the comparison and the order
+    backwards = after is None and before is not None
+    ascending = descending == backwards
+    query = query.add_columns(*columns).order_by(None)
+    if after is not None:
+        query = query.filter(key < bound(after) if descending else key > bound(after))
+    elif before is not None:
+        query = query.filter(key > bound(before) if descending else key < bound(before))
+    query = query.order_by(*(c.asc() if ascending else c.desc() for c in columns))
+
+    rows = query.limit(per_page + 1).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if backwards:
+        rows.reverse()
+    if not rows:
+        return Page([])
+
+    items = [row[0] for row in rows]
+    first_key = tuple(rows[0][1:])
+    last_key = tuple(rows[-1][1:])
+    if backwards:
+        next_cursor = encode_cursor(last_key)
+        prev_cursor = encode_cursor(first_key) if has_more else None
+    else:
+        next_cursor = encode_cursor(last_key) if has_more else None
+        prev_cursor = encode_cursor(first_key) if after is not None else None
+    return Page(items, next_cursor=next_cursor, prev_cursor=prev_cursor)
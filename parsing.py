@@ -0,0 +1,84 @@
+"""
+Parsers that turn free-form salary and experience text into numeric ranges,
+so they can be stored in indexed columns and range-queried in SQL.
+"""
+import re
+
+# Multipliers to rupees for the units employers actually write
+_SALARY_UNITS = {
+    'k': 1_000,
+    'thousand': 1_000,
+    'l': 100_000,
+    'lac': 100_000,
+    'lacs': 100_000,
+    'lakh': 100_000,
+    'lakhs': 100_000,
+    'lpa': 100_000,
+    'cr': 10_000_000,
+    'crore': 10_000_000,
+    'crores': 10_000_000,
+}
+
+_AMOUNT_RE = re.compile(
+    r'(\d+(?:,\d+)*(?:\.\d+)?)\s*(k|thousand|lpa|lakhs?|lacs?|l|crores?|cr)?\b',
+    re.IGNORECASE
+)
+_MONTHLY_RE = re.compile(r'month|/\s*mo\b|\bpm\b|p\.m\.', re.IGNORECASE)
+
+_RANGE_RE = re.compile(r'(\d+)\s*-\s*(\d+)')
+_OPEN_RE = re.compile(r'(\d+)\s*\+')
+_SINGLE_RE = re.compile(r'(\d+)')
+_MONTHS_RE = re.compile(r'\b(?:months?|mos?)\b')
+_YEARS_RE = re.compile(r'\b(?:years?|yrs?)\b')
+
+
+def parse_salary(text):
+    """
+    Parse salary text like "₹8-10 LPA", "₹3.5-5 LPA" or "₹10k/month".
+
+    Returns (min_annual, max_annual) in rupees, or None if no amount is found.
+    A unit written once applies to the whole range ("8-10 LPA").
+    """
+    if not text:
+        return None
+    amounts = _AMOUNT_RE.findall(text)[:2]
+    if not amounts:
+        return None
+    # Fall back to the last written unit for bare numbers
+    default_unit = next((unit for _, unit in reversed(amounts) if unit), '')
+    values = []
+    for number, unit in amounts:
+        multiplier = _SALARY_UNITS.get((unit or default_unit).lower(), 1)
+        values.append(float(number.replace(',', '')) * multiplier)
+    if _MONTHLY_RE.search(text):
+        values = [value * 12 for value in values]
+    return (int(min(values)), int(max(values)))
+
+
+def parse_experience(text):
+    """
+    Parse experience text like "2-4 years", "5+ years", "6 months" or "Fresher".
+
+    Returns (min_years, max_years) with max_years None when open-ended,
+    or None if the text cannot be understood. Months are rounded down to
+    whole years, so "6 months" is (0, 0) and "6-18 months" is (0, 1).
+    """
+    if not text:
+        return None
+    text = text.lower()
+    if 'fresher' in text:
+        return (0, 0)
+    # Counts are months only when no year unit is written ("1 year 6 months" stays in years)
+    per_year = 12 if _MONTHS_RE.search(text) and not _YEARS_RE.search(text) else 1
+    match = _RANGE_RE.search(text)
+    if match:
+        low, high = int(match.group(1)) // per_year, int(match.group(2)) // per_year
+        return (min(low, high), max(low, high))
+    match = _OPEN_RE.search(text)
+    if match:
+        return (int(match.group(1)) // per_year, None)
+    match = _SINGLE_RE.search(text)
+    if match:
+        years = int(match.group(1)) // per_year
+        return (years, years)
+    return None
@@ -0,0 +1,199 @@
+"""
+Per-request SQL and template profiling.
+
+When enabled, every request records how many SQL statements it ran, how long
+they took, and how long Jinja rendering took. The totals are sent back in a
+``Server-Timing`` header (visible in browser dev tools), aggregated into
+per-route latency histograms for ``/_metrics``, and a warning is logged when
+the same statement shape runs many times in one request (the N+1 pattern).
+
+When disabled, ``init_app`` registers nothing, so there is no per-request cost.
+Metrics are kept per worker process.
+"""
+import re
+import threading
+import time
+from collections import Counter
+
+from flask import before_render_template, g, has_request_context, request, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Histogram bucket upper bounds in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf'))
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_PARAM_LIST_RE = re.compile(r'\((?:\s*\?\s*,)+\s*\?\s*\)')
+
+
+def statement_shape(statement):
+    """Normalize SQL so executions that differ only in parameters compare equal."""
+    shape = _WHITESPACE_RE.sub(' ', statement).strip()
+    return _PARAM_LIST_RE.sub('(?)', shape)
+
+
+class RequestProfile:
+    """Counters for a single request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.statements = Counter()
+        self.render_count = 0
+        self.render_time = 0.0
+        self._query_started = []
+        self._render_started = []
+
+
+class RouteStats:
+    """Latency histogram and SQL totals for one route."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS_MS)
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.render_ms = 0.0
+        self.repeated_query_warnings = 0
+
+    def observe(self, elapsed_ms, profile, repeated):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                break
+        self.sql_count += profile.sql_count
+        self.sql_ms += profile.sql_time * 1000
+        self.render_ms += profile.render_time * 1000
+        self.repeated_query_warnings += repeated
+
+    def percentile(self, fraction):
+        """Upper bucket bound containing the given fraction of requests."""
+        if not self.count:
+            return None
+        threshold = fraction * self.count
+        seen = 0
+        for bound, hits in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += hits
+            if seen >= threshold:
+                return bound if bound != float('inf') else None
+        return None
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else None,
+            'p50_ms_le': self.percentile(0.50),
+            'p95_ms_le': self.percentile(0.95),
+            'p99_ms_le': self.percentile(0.99),
+            'histogram_ms': [
+                {'le': '+Inf' if bound == float('inf') else bound, 'count': hits}
+                for bound, hits in zip(LATENCY_BUCKETS_MS, self.buckets)
+            ],
+            'sql_per_request': round(self.sql_count / self.count, 2) if self.count else None,
+            'sql_ms': round(self.sql_ms, 3),
+            'render_ms': round(self.render_ms, 3),
+            'repeated_query_warnings': self.repeated_query_warnings,
+        }
+
+
+class Profiler:
+    """Flask extension collecting request profiles and per-route metrics."""
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.repeat_threshold = 5
+        self.routes = {}
+        self._lock = threading.Lock()
+        self._app = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config.get('PROFILING_ENABLED', False)
+        self.repeat_threshold = app.config.get('PROFILING_REPEAT_THRESHOLD', 5)
+        if not self.enabled:
+            return
+        self._app = app
+        event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+        before_render_template.connect(self._before_render, app)
+        template_rendered.connect(self._after_render, app)
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+    # --- collection hooks ---
+
+    def _current(self):
+        # Engine events are global; only count work for requests this profiler started
+        if not has_request_context() or g.get('_profiler') is not self:
+            return None
+        return g.get('_profile')
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        profile = self._current()
+        if profile is not None:
+            profile._query_started.append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        profile = self._current()
+        if profile is None or not profile._query_started:
+            return
+        profile.sql_time += time.perf_counter() - profile._query_started.pop()
+        profile.sql_count += 1
+        profile.statements[statement_shape(statement)] += 1
+
+    def _before_render(self, sender, template, context, **extra):
+        profile = self._current()
+        if profile is not None:
+            profile._render_started.append(time.perf_counter())
+
+    def _after_render(self, sender, template, context, **extra):
+        profile = self._current()
+        if profile is None or not profile._render_started:
+            return
+        profile.render_time += time.perf_counter() - profile._render_started.pop()
+        profile.render_count += 1
+
+    def _start_request(self):
+        g._profiler = self
+        g._profile = RequestProfile()
+
+    def _finish_request(self, response):
+        profile = g.pop('_profile', None)
+        g.pop('_profiler', None)
+        if profile is None:
+            return response
+        elapsed_ms = (time.perf_counter() - profile.started) * 1000
+        route = f'{request.method} {request.url_rule.rule if request.url_rule else "<unmatched>"}'
+
+        repeated = 0
+        for shape, count in profile.statements.items():
+            if count >= self.repeat_threshold:
+                repeated += 1
+                self._app.logger.warning(
+                    'Possible N+1: %s ran the same statement %d times: %s', route, count, shape[:300])
+
+        with self._lock:
+            self.routes.setdefault(route, RouteStats()).observe(elapsed_ms, profile, repeated)
+
+        response.headers.add('Server-Timing', ', '.join([
+            f'sql;dur={profile.sql_time * 1000:.2f};desc="{profile.sql_count} queries"',
+            f'render;dur={profile.render_time * 1000:.2f};desc="{profile.render_count} templates"',
+            f'app;dur={elapsed_ms:.2f}',
+        ]))
+        return response
+
+    # --- reporting ---
+
+    def snapshot(self):
+        """Per-route metrics for this worker process."""
+        with self._lock:
+            return {route: stats.to_dict() for route, stats in sorted(self.routes.items())}
+
+    def reset(self):
+        with self._lock:
+            self.routes.clear()
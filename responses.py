@@ -0,0 +1,83 @@
+"""
+Helpers for cacheable HTTP responses: strong ETags, conditional GET and
+gzip/brotli negotiation for bodies that are expensive to rebuild or large to send.
+
+Brotli is used only when the optional ``brotli`` package is installed.
+"""
+import gzip
+import hashlib
+from functools import cached_property
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip is always available
+    brotli = None
+
+
+class StaticPayload:
+    """
+    A response body prepared once: hashed for its ETag, compressed on first use.
+
+    Long-lived payloads use the slowest, smallest settings; per-query payloads
+    can pass cheaper levels.
+    """
+
+    def __init__(self, body, mimetype='application/json', gzip_level=9, brotli_quality=11):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    @cached_property
+    def gzipped(self):
+        # mtime=0 keeps the compressed bytes (and so their ETag) deterministic
+        return gzip.compress(self.body, compresslevel=self.gzip_level, mtime=0)
+
+    @cached_property
+    def brotlied(self):
+        return brotli.compress(self.body, quality=self.brotli_quality)
+
+    def encoded(self, encoding):
+        """Body bytes for a content coding chosen by negotiate_encoding()."""
+        if encoding == 'br':
+            return self.brotlied
+        if encoding == 'gzip':
+            return self.gzipped
+        return self.body
+
+
+# Content codings we can produce, in order of preference, with their ETag suffixes
+ENCODING_SUFFIXES = {'br': '-br', 'gzip': '-gz'}
+
+
+def negotiate_encoding():
+    """Best content coding the client accepts: 'br', 'gzip' or None for identity."""
+    offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+    return request.accept_encodings.best_match(offered)
+
+
+def payload_response(payload, max_age=3600):
+    """
+    Serve a StaticPayload, answering If-None-Match with 304 and sending a
+    compressed variant when the client accepts one.
+    """
+    encoding = negotiate_encoding()
+    # Each encoding is a different byte sequence, so it gets its own strong ETag
+    etag = payload.etag + ENCODING_SUFFIXES.get(encoding, '')
+
+    response = current_app.response_class(mimetype=payload.mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.vary.add('Accept-Encoding')
+
+    if request.if_none_match.contains(etag):
+        response.status_code = 304
+        return response
+    response.set_data(payload.encoded(encoding))
+    if encoding:
+        response.content_encoding = encoding
+    return response
@@ -0,0 +1,38 @@
+"""
+Lightweight in-place schema upgrades for existing SQLite databases.
+
+``db.create_all()`` only creates missing tables, so columns and indexes added
+to models later never reach a database created by an older version. This
+module adds them with ALTER TABLE / CREATE INDEX so no manual migration is needed.
+"""
+from sqlalchemy import inspect, text
+
+
+def upgrade_schema(engine, metadata):
+    """
+    Add missing columns and indexes for every existing table in ``metadata``.
+
+    Returns a list of "table.column" names that were added.
+    """
+    added = []
+    with engine.begin() as conn:
+        # Inspect on the same connection: a second one would wait on this transaction's write lock
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {col['name'] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                ddl = f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+                if column.server_default is not None:
+                    default = column.server_default.arg
+                    ddl += f" DEFAULT '{default}'" if isinstance(default, str) else f' DEFAULT {default}'
+                conn.execute(text(ddl))
+                added.append(f'{table.name}.{column.name}')
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+    return added
@@ -0,0 +1,121 @@
+"""
+Full-text search for job postings.
+
+Jobs are mirrored into an SQLite FTS5 table (``job_fts``) whose rowid is the
+job id, so matches can be joined straight back onto the ``job`` table and
+ranked with bm25 instead of scanning every row with ``LIKE '%q%'``.
+"""
+import re
+
+from sqlalchemy import bindparam, column, func, literal_column, select, table, text
+
+SEARCH_TABLE = 'job_fts'
+
+# bm25 weights per indexed column: title, company, location, description
+SEARCH_WEIGHTS = (10.0, 5.0, 5.0, 1.0)
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+_fts = table(SEARCH_TABLE, column('rowid'))
+
+
+def search_index_exists(session):
+    """Return True if the FTS table has been created in this database."""
+    row = session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {'name': SEARCH_TABLE}
+    ).first()
+    return row is not None
+
+
+def create_search_index(session):
+    """Create the FTS table (no-op if it already exists)."""
+    # prefix='2 3' keeps short prefix queries ("dev*") on the index
+    session.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        "title, company, location, description, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    ))
+
+
+def rebuild_search_index(session):
+    """Drop and repopulate the FTS table from the job table. Returns the row count."""
+    session.execute(text(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+    create_search_index(session)
+    result = session.execute(text(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, title, company, location, description) "
+        "SELECT id, title, company, location, description FROM job"
+    ))
+    return result.rowcount
+
+
+def ensure_search_index(session):
+    """Create and backfill the FTS table if it is missing."""
+    if not search_index_exists(session):
+        rebuild_search_index(session)
+
+
+def index_job(session, job):
+    """Insert or refresh a single job in the FTS table. Job must have an id (flush first)."""
+    session.execute(
+        text(
+            f"INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, title, company, location, description) "
+            "VALUES (:id, :title, :company, :location, :description)"
+        ),
+        {
+            'id': job.id,
+            'title': job.title,
+            'company': job.company,
+            'location': job.location,
+            'description': job.description,
+        }
+    )
+
+
+def index_jobs(session, job_ids):
+    """Insert or refresh many jobs in the FTS table with one set-based statement."""
+    if not job_ids:
+        return
+    session.execute(
+        text(
+            f"INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, title, company, location, description) "
+            "SELECT id, title, company, location, description FROM job WHERE id IN :ids"
+        ).bindparams(bindparam('ids', expanding=True)),
+        {'ids': list(job_ids)}
+    )
+
+def unindex_job(session, job_id):
+    """Remove a job from the FTS table."""
+    session.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :id"), {'id': job_id})
+
+
+def build_match_expression(query):
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term ("dev"*), so user input can never
+    inject FTS operators and partially typed words still match. Terms are ANDed.
+    Returns None when the query has no searchable words.
+    """
+    tokens = _TOKEN_RE.findall(query.lower())
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def ranked_matches(match_expression):
+    """
+    Subquery of (job_id, score) for a MATCH expression.
+
+    Lower score means more relevant (bm25 convention), so order ascending.
+    """
+    fts_table = literal_column(SEARCH_TABLE)
+    return (
+        select(
+            _fts.c.rowid.label('job_id'),
+            func.bm25(fts_table, *SEARCH_WEIGHTS).label('score')
+        )
+        .select_from(_fts)
+        .where(fts_table.op('MATCH')(match_expression))
+        .subquery('ranked')
+    )
+
@@ -0,0 +1,6 @@
+"""Several worker processes writing to one SQLite file at once must not lose or fail writes."""
+from bench.concurrent_writes import main
+
+
+def test_concurrent_writers_have_no_errors(tmp_path):
+    assert main(['--workers', '4', '--iterations', '5', '--db', str(tmp_path / 'bench.db')]) == 0
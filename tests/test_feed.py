@@ -0,0 +1,42 @@
+"""Paging an updated_since sync one change at a time must list every post, edit and delete exactly once."""
+from app import create_app
+from database import db
+from feed import format_timestamp
+from models import User, utcnow
+
+
+def test_updated_since_pages_across_a_delete(tmp_path):
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path / "feed.db"}', 'CACHE_BACKEND': 'null',
+                      'FEED_SYNC_OVERLAP': 0, 'PASSWORD_HASH_WORKERS': 0})
+    with app.app_context():
+        employer = User(username='feed_employer', email='feed@example.com', password='-', role='employer')
+        db.session.add(employer)
+        db.session.commit()
+        employer_id = employer.id
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = employer_id
+        sess['role'] = 'employer'
+    since = format_timestamp(utcnow())
+    form = {'title': 'Feed job', 'company': 'Acme', 'location': 'Remote', 'salary': '₹8-10 LPA',
+            'description': 'Paging test', 'experience': '2-4 years'}
+    for _ in range(3):
+        client.post('/post-job', data=form)
+    with app.app_context():
+        first, second, third = [job_id for (job_id,) in db.session.execute(
+            db.text('SELECT id FROM job WHERE employer_id = :id ORDER BY id'), {'id': employer_id})]
+    client.post(f'/edit-job/{first}', data=dict(form, title='Feed job (edited)'))
+    client.post(f'/delete-job/{second}')
+
+    changes = []
+    args = {'updated_since': since, 'limit': 1, 'format': 'json'}
+    while True:
+        page = client.get('/api/v1/jobs', query_string=args).get_json()
+        changes += [(record['id'], record.get('deleted', False)) for record in page['jobs']]
+        if page['next_cursor'] is None:
+            break
+        args['after'] = page['next_cursor']
+
+    assert sorted(changes) == [(first, False), (second, True), (third, False)]
+    assert changes[-2:] == [(first, False), (second, True)]  # Oldest change first: the edit, then the delete
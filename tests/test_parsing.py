@@ -0,0 +1,25 @@
+"""Free-text salary and experience must parse to the ranges the home page filters on."""
+import pytest
+
+from parsing import parse_experience, parse_salary
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('₹8-10 LPA', (800000, 1000000)),
+    ('₹3.5-5 LPA', (350000, 500000)),
+    ('₹10k/month', (120000, 120000)),
+    ('₹40,000 per month', (480000, 480000)),
+    ('1.2 Cr', (12000000, 12000000)),
+])
+def test_parse_salary(text, expected):
+    assert parse_salary(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('5+ years', (5, None)),
+    ('Fresher', (0, 0)),
+    ('6-18 months', (0, 1)),
+    ('1 year 6 months', (1, 1)),
+])
+def test_parse_experience(text, expected):
+    assert parse_experience(text) == expected